@@ -1,13 +1,13 @@
 
 from check_input import *
 from account import Account
-import csv, random
+from name_index import NameIndex
+from rules import today
 
 import tkinter as tk
-from PIL import Image, ImageTk
 from tkinter import messagebox
 
-ACC_FILENAME = "users.csv"
+MATCH_LIMIT = 50 # accounts listed at once; typing in the search box narrows them down
 
 class AccountManager:
     """ Manages multiple user accounts, handling the loading, creation, and removal of Account
@@ -16,6 +16,14 @@ class AccountManager:
         frame (Frame): The GUI frame where the pet is displayed
         acc (Account): The account associated with this pet
         app (App): the App instance to refer to
+        service (DaycareService): creates and deletes account records
+        assets (AssetCache): shared images for every screen
+        screens (ScreenManager): cached screens, raised instead of rebuilt
+        listbox (Listbox): the account list of the screen currently shown
+        _users (dict): user_id -> Account, in creation order
+        _by_name (dict): username -> Account, kept in sync with _users
+        _index (NameIndex): usernames in sorted order for the prefix search, kept in sync with _users
+        _shown (list): the Accounts in the listbox, in listbox order
         _selected_user (Account): The Account instance to pass on        
     """
     def __init__(self, root, frame, app):
@@ -25,63 +33,115 @@ class AccountManager:
             frame (Frame): the Frame instance to be passed on
             app (App): the App instance to pass on
         """
-        self._users = []
+        self._users = {}
+        self._by_name = {}
+        self._index = NameIndex()
+        self._shown = []
         self.root = root
         self.frame = frame
         self.app = app
+        self.service = app.service
+        self.assets = app.assets
+        self.screens = app.screens
         self._selected_user = None
-        try:            
-            with open(ACC_FILENAME, mode="r") as file:
-                reader = csv.reader(file)            
-                for row in reader:
-                    username, user_id = row
-                    self._users.append(Account(self.root, self.frame, app, username, user_id))
-        except FileNotFoundError: # create new file if users.csv not found            
-            open(ACC_FILENAME, mode="w").close()
+        for account in self.service.users(self.make_account):
+            self._add_user(account)
     
     @property
     def user(self):
         return self._selected_user
+
+    def make_account(self, username, user_id, last_active=""):
+        """ Account factory for the service
+        Returns:
+            an Account of this app
+        """
+        return Account(self.root, self.frame, self.app, username, user_id, last_active)
+
+    def _add_user(self, account):
+        """ List an account and index it by username and id
+        Args:
+            account (Account): the Account instance to add
+        """
+        self._users[account.user_id] = account
+        self._by_name[account.username] = account
+        self._index.add(account.username)
+
+    def _remove_user(self, user_id):
+        """ Drop an account from the list and the indexes
+        Args:
+            user_id (str): id of the account
+        Returns:
+            the removed Account
+        """
+        account = self._users.pop(user_id)
+        self._by_name.pop(account.username, None)
+        self._index.remove(account.username)
+        return account
+
+    def find_user(self, username):
+        """ Args:
+            username (str): username of the account
+        Returns:
+            the Account with that username, None if there is none
+        """
+        return self._by_name.get(username)
+
+    def get_user(self, user_id):
+        """ Args:
+            user_id (str): id of the account
+        Returns:
+            the Account with that id, None if there is none
+        """
+        return self._users.get(user_id)
   
     def open_new_acc_screen(self):
         """ Display the screen to create a new account
         """
-        # Clear screen
-        for widget in self.frame.winfo_children():
-            widget.destroy()
+        self.screens.show(self, "new_account", self.build_new_acc_screen, self.refresh_new_acc_screen)
+
+    def build_new_acc_screen(self, screen):
+        """ Create the widgets of the new account screen
+        Args:
+            screen (Frame): the frame the screen is built in
+        """
+        self.new_acc_frame = screen
 
         # Change bg
-        self.new_bg_image = Image.open("interfaces/new_account_bg.png")
-        self.new_bg_photo = ImageTk.PhotoImage(self.new_bg_image)
-        self.bg_label = tk.Label(self.frame, image=self.new_bg_photo)
-        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        self.new_account_bg_photo = self.assets.photo("interfaces/new_account_bg.png")
+        self.new_account_bg_label = tk.Label(screen, image=self.new_account_bg_photo)
+        self.new_account_bg_label.place(x=0, y=0, relwidth=1, relheight=1)
         
         # RETURN button
-        self.return_img = Image.open("interfaces/return_button.png").resize((33,33))
-        self.return_button_image = ImageTk.PhotoImage(self.return_img)     
-        self.return_button = tk.Button(self.frame, image=self.return_button_image, background="#EE8B5F",
+        self.return_button_image = self.assets.photo("interfaces/return_button.png", (33, 33))
+        self.return_button = tk.Button(screen, image=self.return_button_image, background="#EE8B5F",
                                        activebackground="#EE8B5F", highlightbackground="#EE8B5F",
                                        command=(self.app).setup_main_screen, borderwidth=0)
         self.return_button.place(relx=0.05, rely=0.03)
         
         # Enter your username:
-        self.label = tk.Label(self.frame, text="Enter your username:", font=("Courier", 17, "bold"), fg="#72615A", bg= "#C77E5D")
+        self.label = tk.Label(screen, text="Enter your username:", font=("Courier", 17, "bold"), fg="#72615A", bg= "#C77E5D")
         self.label.place(relx=0.5, rely=0.35, anchor="center")
 
         # Add a text input (Entry widget)
-        self.username_entry = tk.Entry(self.frame, font=("Courier", 14), width = 20)
+        self.username_entry = tk.Entry(screen, font=("Courier", 14), width = 20)
         self.username_entry.place(relx=0.5, rely=0.40, anchor="center")
 
         # CONFIRM BUTTON
-        self.confirm_button_image = Image.open("interfaces/confirm_button.png")
-        self.confirm_button_image = self.confirm_button_image.resize((310, 106))
-        self.confirm_button_photo = ImageTk.PhotoImage(self.confirm_button_image)
+        self.confirm_button_photo = self.assets.photo("interfaces/confirm_button.png", (310, 106))
         
-        self.confirm_button = tk.Button(self.frame, image=self.confirm_button_photo, 
+        self.confirm_button = tk.Button(screen, image=self.confirm_button_photo, 
                                         command = self.process_new_acc, 
                                         bd=0, highlightthickness=0, activebackground="#EE8B5F")
         self.confirm_button.place(relx=0.5, rely=0.62, anchor="center")
         
+    def refresh_new_acc_screen(self):
+        """ Clear what was typed on a previous visit
+        """
+        self.username_entry.delete(0, tk.END)
+        if hasattr(self, 'error_label'):
+            self.error_label.destroy()
+
     def process_new_acc(self):
         """ Handles the creation of a new account        
         """
@@ -95,7 +155,7 @@ class AccountManager:
                 self.error_label.destroy()
             
             # Show an error message if the username is empty
-            self.error_label = tk.Label(self.frame, text="Please enter a username", 
+            self.error_label = tk.Label(self.new_acc_frame, text="Please enter a username", 
                                         font=("Courier", 13, "bold"), fg="white", bg="#BC0E00")
             self.error_label.place(relx=0.5, rely=0.31, anchor="center")
             return  # Stop further processing
@@ -104,11 +164,9 @@ class AccountManager:
         if hasattr(self, 'error_label'):
                 self.error_label.destroy()
         
-        curr_usernames = [account.username for account in self._users]
-        
-        while new_username in curr_usernames:
+        if new_username in self._by_name:
             # Show error message that the username is taken
-            self.error_label = tk.Label(self.frame, text="That username is taken", 
+            self.error_label = tk.Label(self.new_acc_frame, text="That username is taken", 
                                         font=("Courier", 13, "bold"), fg="white", bg="#BC0E00")
             self.error_label.place(relx=0.5, rely=0.31, anchor="center")
 
@@ -118,82 +176,75 @@ class AccountManager:
 
             return  # Exit the current method, forcing the user to try again
 
-        # Generate a random 5-digit ID
-        curr_ids = [account.user_id for account in self._users]
-        while True:
-            new_id = str(random.randint(10000, 99999))
-            if new_id not in curr_ids:
-                break
-        new_acc = Account(self.root, self.frame,self.app, new_username, new_id)
-        self._users.append(new_acc)
+        # saving new account
+        new_id = self.service.create_user(new_username)
+        new_acc = self.make_account(new_username, new_id, today())
+        self._add_user(new_acc)
         self._selected_user = new_acc
         
-        # saving new account to csv
-        with open(ACC_FILENAME, mode="a", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow([new_username, new_id])
-        
         (self._selected_user).open_home_screen()
   
     def open_login_screen(self):
         """ Display screen to choose accounts
         """
-        for widget in self.frame.winfo_children():
-            widget.destroy()
-                   
-        self.new_bg_image = Image.open("interfaces/choose_account_bg.png")
-        self.new_bg_photo = ImageTk.PhotoImage(self.new_bg_image)
+        self.screens.show(self, "login", self.build_login_screen,
+                          lambda: self.refresh_account_list(self.login_listbox, self.login_no_user_label,
+                                                            self.login_search))
+
+    def build_login_screen(self, screen):
+        """ Create the widgets of the login screen
+        Args:
+            screen (Frame): the frame the screen is built in
+        """
+        self.login_bg_photo = self.assets.photo("interfaces/choose_account_bg.png")
         
-        self.bg_label = tk.Label(self.frame, image=self.new_bg_photo)
-        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        self.login_bg_label = tk.Label(screen, image=self.login_bg_photo)
+        self.login_bg_label.place(x=0, y=0, relwidth=1, relheight=1)
         
         # ACCOUNT LABEL
-        account_label = tk.Label(self.frame, text="Accounts", font=("Courier", 22, "bold"), 
+        account_label = tk.Label(screen, text="Accounts", font=("Courier", 22, "bold"), 
                                 fg="#72615A", bg="#EE8B5F")
         account_label.place(relx=0.5, rely=0.18, anchor="center")     
         
         # RETURN button
-        self.return_img = Image.open("interfaces/return_button.png").resize((33,33))
-        self.return_button_image = ImageTk.PhotoImage(self.return_img)     
-        self.return_button = tk.Button(self.frame, image=self.return_button_image, background="#EE8B5F",
+        self.return_button_image = self.assets.photo("interfaces/return_button.png", (33, 33))
+        self.return_button = tk.Button(screen, image=self.return_button_image, background="#EE8B5F",
                                        activebackground="#EE8B5F", highlightbackground="#EE8B5F",
                                        command=(self.app).setup_main_screen, borderwidth=0)
         self.return_button.place(relx=0.05, rely=0.03)
+
+        # SEARCH BOX; every key narrows the list to the accounts starting with what was typed
+        self.login_search = tk.Entry(screen, font=("Courier", 14), width=20)
+        self.login_search.place(relx=0.5, rely=0.225, anchor="center")
+        self.login_search.bind("<KeyRelease>", lambda event: self.refresh_account_list(
+            self.login_listbox, self.login_no_user_label, self.login_search))
                 
         # SCROLLBAR; frame
-        listbox_frame = tk.Frame(self.frame, bg="white")
+        listbox_frame = tk.Frame(screen, bg="white")
         listbox_frame.place(relx=0.5, rely=0.38, anchor="center")
 
-        # Create a listbox with options
-        self.listbox = tk.Listbox(listbox_frame, font=("Courier", 23), height=5, width=15,
+        # Create a listbox with options; filled on every visit by refresh_account_list
+        self.login_listbox = tk.Listbox(listbox_frame, font=("Courier", 23), height=5, width=15,
                                 borderwidth=0, highlightthickness=0, selectmode=tk.SINGLE,
                                 fg="#72615A", bg="white", selectbackground="#72615A", 
                                 selectforeground="white", activestyle="none")
-        self.listbox.pack(side="left", fill="both", expand=True, pady=10)  # Pack inside the listbox_frame
-
-        # Add items to the listbox
-        for account in self._users:
-            self.listbox.insert(tk.END, " " + account.username)
+        self.login_listbox.pack(side="left", fill="both", expand=True, pady=10)  # Pack inside the listbox_frame
         
-        if not self._users:
-            # Display "No accounts located" message above the listbox
-            no_user_label = tk.Label(self.frame, text="No account located", font=("Courier", 16, "bold"),
-                                     fg="#BC0E00", bg="white", pady=20)
-            no_user_label.place(relx=0.5, rely=0.33, anchor="center")
+        # "No accounts located" message above the listbox, placed only while there are none
+        self.login_no_user_label = tk.Label(screen, text="No account located", font=("Courier", 16, "bold"),
+                                            fg="#BC0E00", bg="white", pady=20)
         
         # Create a scrollbar for the listbox
-        scrollbar = tk.Scrollbar(listbox_frame, orient="vertical", command=self.listbox.yview)
+        scrollbar = tk.Scrollbar(listbox_frame, orient="vertical", command=self.login_listbox.yview)
         scrollbar.pack(side="right", fill="y")
 
         # Link the scrollbar to the Listbox
-        self.listbox.config(yscrollcommand=scrollbar.set)
+        self.login_listbox.config(yscrollcommand=scrollbar.set)
         
         # CONFIRM BUTTON
-        button_bg_img = Image.open("interfaces/confirm_button.png")
-        button_bg_img = button_bg_img.resize((240, 80))
-        button_bg_photo = ImageTk.PhotoImage(button_bg_img)
+        button_bg_photo = self.assets.photo("interfaces/confirm_button.png", (240, 80))
 
-        self.select_button = tk.Button(self.frame, image=button_bg_photo, 
+        self.select_button = tk.Button(screen, image=button_bg_photo, 
                                     command = self.handle_login, bd=0, border=0,
                                     font=("Courier", 12), borderwidth=0, 
                                     highlightthickness=0, activebackground="#EE8B5F", relief="flat")
@@ -202,6 +253,25 @@ class AccountManager:
         # Keep a reference to the button background image to prevent garbage collection
         self.select_button.image = button_bg_photo
   
+    def refresh_account_list(self, listbox, no_user_label, search):
+        """ Fill an account list with the first MATCH_LIMIT accounts, in alphabetical order, whose
+        username starts with the search text, and make it the active one
+        Args:
+            listbox (Listbox): the listbox of the screen being shown
+            no_user_label (Label): the message shown when no account matches
+            search (Entry): the screen's search box
+        """
+        self.listbox = listbox
+        self._shown = [self._by_name[name] for name in self._index.matches(search.get().strip(), MATCH_LIMIT)]
+        listbox.delete(0, tk.END)
+        for account in self._shown:
+            listbox.insert(tk.END, " " + account.username)
+        
+        if self._shown:
+            no_user_label.place_forget()
+        else:
+            no_user_label.place(relx=0.5, rely=0.33, anchor="center")
+
     def handle_login(self):
         """ Handles user selection and calls next screen
         """
@@ -211,71 +281,73 @@ class AccountManager:
             return
         selected_index = selected_index[0]  # get index from tuple of size 1
 
-        selected_user = self._users[selected_index]  # get the Account object by index
+        selected_user = self._shown[selected_index]  # get the Account object by index
+        selected_user.last_active = self.service.touch_user(selected_user.user_id, selected_user.last_active)
         self._selected_user = selected_user        
         (self._selected_user).open_home_screen()
         
     def open_setting_screen(self): 
         """ Displays the starter setting screen
         """
-        for widget in self.frame.winfo_children():
-            widget.destroy()
-                   
-        self.new_bg_image = Image.open("interfaces/choose_account_bg.png")
-        self.new_bg_photo = ImageTk.PhotoImage(self.new_bg_image)
+        self.screens.show(self, "settings", self.build_setting_screen,
+                          lambda: self.refresh_account_list(self.setting_listbox, self.setting_no_user_label,
+                                                            self.setting_search))
+
+    def build_setting_screen(self, screen):
+        """ Create the widgets of the setting screen
+        Args:
+            screen (Frame): the frame the screen is built in
+        """
+        self.setting_bg_photo = self.assets.photo("interfaces/choose_account_bg.png")
 
         # Show background on pick screen
-        self.bg_label = tk.Label(self.frame, image=self.new_bg_photo)
-        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)        
+        self.setting_bg_label = tk.Label(screen, image=self.setting_bg_photo)
+        self.setting_bg_label.place(x=0, y=0, relwidth=1, relheight=1)        
         
         # RETURN BUTTON
-        self.return_img = Image.open("interfaces/return_button.png").resize((33,33))
-        self.return_button_image = ImageTk.PhotoImage(self.return_img)     
-        self.return_button = tk.Button(self.frame, image=self.return_button_image, background="#EE8B5F",
+        self.return_button_image = self.assets.photo("interfaces/return_button.png", (33, 33))
+        self.return_button = tk.Button(screen, image=self.return_button_image, background="#EE8B5F",
                                        activebackground="#EE8B5F", highlightbackground="#EE8B5F",
                                        command=(self.app).setup_main_screen, borderwidth=0)
         self.return_button.place(relx=0.05, rely=0.03)
         
         # ACCOUNT LABEL
-        account_label = tk.Label(self.frame, text="Accounts", font=("Courier", 22, "bold"), 
+        account_label = tk.Label(screen, text="Accounts", font=("Courier", 22, "bold"), 
                                 fg="#72615A", bg="#EE8B5F")
         account_label.place(relx=0.5, rely=0.18, anchor="center")     
+
+        # SEARCH BOX; every key narrows the list to the accounts starting with what was typed
+        self.setting_search = tk.Entry(screen, font=("Courier", 14), width=20)
+        self.setting_search.place(relx=0.5, rely=0.225, anchor="center")
+        self.setting_search.bind("<KeyRelease>", lambda event: self.refresh_account_list(
+            self.setting_listbox, self.setting_no_user_label, self.setting_search))
         
         # SCROLLBAR; frame
-        listbox_frame = tk.Frame(self.frame)
+        listbox_frame = tk.Frame(screen)
         listbox_frame.place(relx=0.5, rely=0.38, anchor="center")
 
-        # Create a listbox with options
-        self.listbox = tk.Listbox(listbox_frame, font=("Courier", 23), height=5, width=15,
-                                borderwidth=0, highlightthickness=0, selectmode=tk.SINGLE,
+        # Create a listbox with options; filled on every visit by refresh_account_list
+        self.setting_listbox = tk.Listbox(listbox_frame, font=("Courier", 23), height=5, width=15,
+                                borderwidth=0, highlightthickness=0, selectmode=tk.MULTIPLE,
                                 fg="#72615A", bg="white", selectbackground="#72615A", 
                                 selectforeground="white", activestyle="none")
-        self.listbox.pack(side="left", fill="both", expand=True)  # Pack inside the listbox_frame
+        self.setting_listbox.pack(side="left", fill="both", expand=True)  # Pack inside the listbox_frame
 
-        # Add items to the listbox
-        for account in self._users:
-            self.listbox.insert(tk.END, " " + account.username)
-
-        # NO ACCOUNTS LOCATED LABEL
-        if not self._users:
-            # Display "No accounts located" message above the listbox
-            no_user_label = tk.Label(self.frame, text="No account located", font=("Courier", 16, "bold"),
-                                     fg="#BC0E00", bg="white", pady=20)
-            no_user_label.place(relx=0.5, rely=0.33, anchor="center")
+        # NO ACCOUNTS LOCATED LABEL, placed only while there are none
+        self.setting_no_user_label = tk.Label(screen, text="No account located", font=("Courier", 16, "bold"),
+                                              fg="#BC0E00", bg="white", pady=20)
         
         # Create a scrollbar for the listbox
-        scrollbar = tk.Scrollbar(listbox_frame, orient="vertical", command=self.listbox.yview)
+        scrollbar = tk.Scrollbar(listbox_frame, orient="vertical", command=self.setting_listbox.yview)
         scrollbar.pack(side="right", fill="y")
 
         # Link the scrollbar to the Listbox
-        self.listbox.config(yscrollcommand=scrollbar.set)
+        self.setting_listbox.config(yscrollcommand=scrollbar.set)
         
         # CONFIRM BUTTON
-        button_bg_img = Image.open("interfaces/delete_button.png")
-        button_bg_img = button_bg_img.resize((240, 90))
-        button_bg_photo = ImageTk.PhotoImage(button_bg_img)
+        button_bg_photo = self.assets.photo("interfaces/delete_button.png", (240, 90))
 
-        self.select_button = tk.Button(self.frame, image=button_bg_photo, 
+        self.select_button = tk.Button(screen, image=button_bg_photo, 
                                     command = self.handle_removal, bd=0, border=0,
                                     font=("Courier", 12), borderwidth=0, 
                                     highlightthickness=0, activebackground="#EE8B5F", relief="flat")
@@ -285,41 +357,38 @@ class AccountManager:
         self.select_button.image = button_bg_photo
   
     def handle_removal(self):
-        """ Handles the removal of selected account        
+        """ Handles the removal of the selected accounts, all deleted in one batch
         """
-        selected_index = self.listbox.curselection() # gives index selection
+        selected_indexes = self.listbox.curselection() # gives index selection
         
-        if not selected_index: # return if no selection is made
+        if not selected_indexes: # return if no selection is made
             return 
-        selected_index = selected_index[0]  # get index from tuple of size 1
 
-        selected_user = self._users[selected_index]  # get the Account object by index
+        selected_users = [self._shown[index] for index in selected_indexes]  # get the Account objects by index
             
         # Ask for confirmation
-        confirmation = messagebox.askyesno(
-            title="Confirm Deletion",
-            message=f"Delete the account of {selected_user.username}?"
-        )
+        if len(selected_users) == 1:
+            message = f"Delete the account of {selected_users[0].username}?"
+        else:
+            message = f"Delete {len(selected_users)} accounts?"
+        confirmation = messagebox.askyesno(title="Confirm Deletion", message=message)
         
-        # Process removal with CSV
+        # Process removal with storage
         if confirmation:            
-            selected_user.wipe_pet_saves()
-            
-            new_rows = []
-            with open(ACC_FILENAME, mode="r", newline="") as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if row and row[1] != selected_user.user_id:
-                        new_rows.append(row)
-
-            # Rewrite CSV without the deleted account
-            with open(ACC_FILENAME, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerows(new_rows)
+            self.app.scheduler.flush() # pending saves must not bring the pets back
+            self.service.delete_users([user.user_id for user in selected_users]) # pets and tasks go with them
 
-            self._users.remove(selected_user)  # Remove from the list of users
+            for user in selected_users:
+                self._remove_user(user.user_id)  # Remove from the list of users
+                user.discard_screens() # its cached screens can never be shown again
 
             # Call back to the main screen
             self.app.back_to_main()
 
+    def start_new_day(self):
+        """ Make every account read its pets again after the daily reset rewrote them
+        """
+        for user in self._users.values():
+            user.unload_pets()
+
             
@@ -0,0 +1,167 @@
+from atlas import load_atlas
+from PIL import Image, ImageTk
+import queue, re, threading
+
+ANIMALS = ("dog", "cat", "ham", "rex", "bronto", "trice")
+PRELOAD_BATCH = 4 # PhotoImages created per Tk slice
+PRELOAD_DELAY = 15 # ms between Tk slices
+
+# every (path, size) the screens ask for; warmed up at startup
+ASSET_MANIFEST = [
+    # backgrounds and banners
+    ("interfaces/template.png", None), ("interfaces/choose_account_bg.png", None),
+    ("interfaces/new_account_bg.png", None), ("interfaces/activity_room.png", None),
+    ("interfaces/task_remove_bg.png", None), ("interfaces/new_task_bg.png", None),
+    ("interfaces/domes_banner.png", None), ("interfaces/dino_banner.png", None),
+    ("interfaces/empty_banner.png", None),
+    # buttons
+    ("interfaces/return_button.png", (33, 33)), ("interfaces/return_button.png", (36, 36)),
+    ("interfaces/return_button.png", (38, 38)),
+    ("interfaces/confirm_button.png", (310, 106)), ("interfaces/confirm_button.png", (240, 80)),
+    ("interfaces/confirm_button.png", (226, 85)), ("interfaces/confirm_button.png", (285, 100)),
+    ("interfaces/delete_button.png", (240, 90)), ("interfaces/bye_button.png", (220, 90)),
+    ("interfaces/setting_icon.png", (45, 40)), ("interfaces/enter_button.png", None),
+    ("interfaces/activity_button.png", None), ("interfaces/event_button.png", None),
+    ("interfaces/remove_button.png", (33, 33)), ("interfaces/add_button.png", (33, 33)),
+    # checkbox icons
+    ("interfaces/completed.png", (30, 30)), ("interfaces/incompleted.png", (30, 30)),
+    ("interfaces/neutral.png", (30, 30)), ("interfaces/exile.png", (30, 30)),
+] + [(f"pets/{animal}.png", (90, 90)) for animal in ANIMALS]
+# pet animation frames and status icons come from the sprite atlas (see atlas.py)
+
+
+class AssetCache:
+    """ Shared image cache for every screen; each image is decoded and resized once per
+    (path, size) and its PhotoImage is kept for the lifetime of the app
+    Attributes:
+        _photos (dict): (path, size) -> ImageTk.PhotoImage
+        _sprites (dict): sprite name -> PIL image sliced from the atlas, None until loaded
+        _decoded (Queue): PIL images decoded by the preload thread, waiting for the Tk thread
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups that had to decode the file
+        preloaded (int): number of images converted by the preload stage
+    """
+    def __init__(self):
+        self._photos = {}
+        self._sprites = None
+        self._sprites_lock = threading.Lock() # the preload thread may load the atlas too
+        self._decoded = queue.Queue()
+        self.hits = 0
+        self.misses = 0
+        self.preloaded = 0
+
+    def _load(self, path, size):
+        """ Decode an image file, resized if needed
+        Args:
+            path (str): path of the image file
+            size (tuple): (width, height) to resize to, None for the original size
+        Returns:
+            the decoded PIL image
+        """
+        image = Image.open(path)
+        if size is not None:
+            return image.resize(size)
+        image.load()
+        return image
+
+    def photo(self, path, size=None):
+        """ Get the PhotoImage of an image file
+        Args:
+            path (str): path of the image file
+            size (tuple, optional): (width, height) to resize to. Defaults to None (original size)
+        Returns:
+            the cached ImageTk.PhotoImage
+        """
+        key = (path, size)
+        photo = self._photos.get(key)
+        if photo is not None:
+            self.hits += 1
+            return photo
+
+        self.misses += 1
+        photo = ImageTk.PhotoImage(self._load(path, size))
+        self._photos[key] = photo
+        return photo
+
+    def _load_sprites(self):
+        """ Returns:
+            dict of sprite name -> PIL image, decoding the atlas on first use
+        """
+        with self._sprites_lock:
+            if self._sprites is None:
+                self._sprites = load_atlas()
+        return self._sprites
+
+    def sprite(self, name):
+        """ Get the PhotoImage of a sprite packed in the atlas
+        Args:
+            name (str): sprite name, e.g. "dog1" or "status3"
+        Returns:
+            the cached ImageTk.PhotoImage
+        """
+        key = ("sprite", name)
+        photo = self._photos.get(key)
+        if photo is not None:
+            self.hits += 1
+            return photo
+
+        self.misses += 1
+        photo = ImageTk.PhotoImage(self._load_sprites()[name])
+        self._photos[key] = photo
+        return photo
+
+    def animation(self, animal):
+        """ Get every animation frame of an animal in order (dog1, dog2, ...)
+        Args:
+            animal (str): animal name from ANIMALS
+        Returns:
+            list of ImageTk.PhotoImage
+        """
+        pattern = re.compile(re.escape(animal) + r"(\d+)$")
+        frames = sorted((int(match.group(1)), name) for name in self._load_sprites()
+                        if (match := pattern.match(name)))
+        return [self.sprite(name) for _, name in frames]
+
+    def preload(self, root, manifest=ASSET_MANIFEST):
+        """ Warm up the cache without blocking the window: a worker thread decodes and resizes
+        the images, and the Tk thread turns them into PhotoImages a few at a time with after()
+        Args:
+            root (Tk): the Tkinter window to schedule conversions on
+            manifest (list, optional): (path, size) pairs to load. Defaults to ASSET_MANIFEST
+        """
+        pending = [key for key in manifest if key not in self._photos]
+        # sprite keys are skipped in _convert_slice once a screen has created them
+        worker = threading.Thread(target=self._decode_all, args=(pending,), daemon=True)
+        worker.start()
+        root.after(PRELOAD_DELAY, self._convert_slice, root, worker)
+
+    def _decode_all(self, keys):
+        """ Worker thread body; PIL work only, Tk must not be touched here
+        Args:
+            keys (list): (path, size) pairs to decode
+        """
+        for name, image in self._load_sprites().items():
+            self._decoded.put((("sprite", name), image))
+        for path, size in keys:
+            try:
+                self._decoded.put(((path, size), self._load(path, size)))
+            except OSError: # missing asset; the screen will report it when used
+                continue
+
+    def _convert_slice(self, root, worker):
+        """ Convert up to PRELOAD_BATCH decoded images, then reschedule until the worker is done
+        Args:
+            root (Tk): the Tkinter window to schedule on
+            worker (Thread): the decoding thread
+        """
+        for _ in range(PRELOAD_BATCH):
+            try:
+                key, image = self._decoded.get_nowait()
+            except queue.Empty:
+                break
+            if key not in self._photos: # a screen may have needed it first
+                self._photos[key] = ImageTk.PhotoImage(image)
+                self.preloaded += 1
+
+        if worker.is_alive() or not self._decoded.empty():
+            root.after(PRELOAD_DELAY, self._convert_slice, root, worker)
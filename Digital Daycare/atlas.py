@@ -0,0 +1,124 @@
+from atomic_write import TEMP_SUFFIX
+from file_lock import lock_for
+from PIL import Image
+import glob, json, os
+
+ATLAS_IMAGE = "pets/atlas.png"
+ATLAS_INDEX = "pets/atlas.json"
+ATLAS_MAX_WIDTH = 4096 # px before starting a new shelf
+SPRITE_PATTERNS = ("pets/*[0-9].png", "interfaces/status[0-9].png") # animation frames and status icons
+
+
+def atlas_sources():
+    """ Locate every image packed into the atlas; a sprite is named after its file (dog1, status3)
+    Returns:
+        dict of sprite name -> image path
+    """
+    sources = {}
+    for pattern in SPRITE_PATTERNS:
+        for path in sorted(glob.glob(pattern)):
+            sources[os.path.splitext(os.path.basename(path))[0]] = path
+    return sources
+
+
+def _replace_file(path, save):
+    """ Write a file next to its target and rename it over, so a reader sees the old or the new file
+    Args:
+        path (str): the file to replace
+        save (callable): writes the content to the path it is given
+    """
+    temp = path + TEMP_SUFFIX
+    save(temp)
+    with open(temp, mode="rb") as file:
+        os.fsync(file.fileno())
+    os.replace(temp, path)
+
+
+def _save_index(index, path):
+    """ Args:
+        index (dict): sprite name -> box
+        path (str): where to write it
+    """
+    with open(path, mode="w") as file:
+        json.dump(index, file, indent=1)
+
+
+def build_atlas(sources=None):
+    """ Pack the sprites into one image with simple shelf packing and write the name -> box index.
+    Both files are replaced atomically under the index's lock, so an instance loading the atlas
+    meanwhile never reads half a file
+    Args:
+        sources (dict, optional): sprite name -> image path. Defaults to atlas_sources()
+    Returns:
+        dict of sprite name -> [left, top, right, bottom]
+    """
+    if sources is None:
+        sources = atlas_sources()
+    images = {name: Image.open(path).convert("RGBA") for name, path in sources.items()}
+
+    # tallest first so each shelf wastes as little height as possible
+    index = {}
+    x = y = shelf_height = width = 0
+    for name in sorted(images, key=lambda name: (-images[name].height, name)):
+        w, h = images[name].size
+        if x + w > ATLAS_MAX_WIDTH and x > 0: # start a new shelf
+            y += shelf_height
+            x = shelf_height = 0
+        index[name] = [x, y, x + w, y + h]
+        x += w
+        shelf_height = max(shelf_height, h)
+        width = max(width, x)
+
+    sheet = Image.new("RGBA", (width, y + shelf_height))
+    for name, box in index.items():
+        sheet.paste(images[name], (box[0], box[1]))
+    with lock_for(ATLAS_INDEX):
+        _replace_file(ATLAS_IMAGE, lambda path: sheet.save(path, format="PNG"))
+        _replace_file(ATLAS_INDEX, lambda path: _save_index(index, path))
+    return index
+
+
+def read_atlas_index():
+    """ Returns:
+        dict of sprite name -> [left, top, right, bottom] from the index file
+    """
+    with open(ATLAS_INDEX, mode="r") as file:
+        return json.load(file)
+
+
+def atlas_is_stale():
+    """ Returns:
+        True if the atlas is missing, older than any of its source images or its index is unreadable
+    """
+    if not os.path.exists(ATLAS_IMAGE) or not os.path.exists(ATLAS_INDEX):
+        return True
+    built = min(os.path.getmtime(ATLAS_IMAGE), os.path.getmtime(ATLAS_INDEX))
+    sources = atlas_sources()
+    try:
+        index = read_atlas_index()
+    except ValueError: # corrupt index
+        return True
+    return any(os.path.getmtime(path) > built for path in sources.values()) or set(sources) != set(index)
+
+
+def load_atlas():
+    """ Decode the atlas once and slice every sprite out of it, rebuilding it first if stale. The
+    check, rebuild and read hold the index's lock so another instance never rebuilds it meanwhile
+    Returns:
+        dict of sprite name -> PIL image
+    """
+    try:
+        with lock_for(ATLAS_INDEX):
+            if atlas_is_stale():
+                build_atlas()
+            index = read_atlas_index()
+            sheet = Image.open(ATLAS_IMAGE)
+            sheet.load()
+    except (OSError, ValueError): # read-only install or a corrupt atlas; fall back to the loose files
+        return {name: Image.open(path) for name, path in atlas_sources().items()}
+    return {name: sheet.crop(tuple(box)) for name, box in index.items()}
+
+
+if __name__ == "__main__":
+    packed = build_atlas()
+    print(f"Packed {len(packed)} sprites into {ATLAS_IMAGE}")
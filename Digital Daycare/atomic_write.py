@@ -0,0 +1,109 @@
+from file_lock import lock_for
+import csv, os
+
+TEMP_SUFFIX = ".tmp"
+
+
+def _fsync_dir(filename):
+    """ Make a rename inside a directory durable (POSIX only; Windows has no directory handles)
+    Args:
+        filename (str): a file in the directory
+    """
+    if os.name == "nt":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_rows(filename, rows):
+    """ Replace the content of a csv file so that a crash leaves either the old or the new file:
+    the rows go to a temp file that is fsynced and then renamed over the target
+    Args:
+        filename (str): the csv file to replace
+        rows (iterable): rows to be written
+    """
+    temp = filename + TEMP_SUFFIX
+    with open(temp, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerows(rows)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp, filename)
+    _fsync_dir(filename)
+
+
+def append_row(filename, row):
+    """ Append a single row to a csv file and fsync it; a crash can at worst leave a partial
+    last row, which recover_files removes
+    Args:
+        filename (str): the csv file to append to
+        row (list): row to be written
+    """
+    append_rows(filename, [row])
+
+
+def append_rows(filename, rows):
+    """ Append rows to a csv file with a single fsync
+    Args:
+        filename (str): the csv file to append to
+        rows (iterable): rows to be written
+    """
+    with open(filename, mode="a", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerows(rows)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def recover_files(columns):
+    """ Startup check after an unclean exit: drop temp files of interrupted rewrites (their target
+    was never replaced, so it is intact) and cut a partial row an interrupted append left behind.
+    Each file is checked under its lock so a write in progress in another instance is left alone
+    Args:
+        columns (dict): csv file -> tuple of the numbers of values a complete row may have
+    Returns:
+        list of messages describing each repair, empty if nothing was wrong
+    """
+    repairs = []
+    for filename, counts in columns.items():
+        with lock_for(filename):
+            repairs.extend(_recover_file(filename, counts))
+    return repairs
+
+
+def _recover_file(filename, counts):
+    """ Args:
+        filename (str): the csv file to check
+        counts (tuple): numbers of values a complete row may have
+    Returns:
+        list of messages describing each repair
+    """
+    repairs = []
+    temp = filename + TEMP_SUFFIX
+    interrupted = os.path.exists(temp)
+    if interrupted:
+        os.remove(temp)
+        repairs.append(f"removed unfinished {temp}")
+
+    if not os.path.exists(filename):
+        return repairs
+    with open(filename, mode="rb") as file:
+        data = file.read()
+    if not data or data.endswith(b"\n"):
+        return repairs
+    # an unterminated last row with the wrong number of values was cut short; one with the right
+    # number is a hand-edited or older file missing its final line end and is kept
+    start = data.rfind(b"\n") + 1
+    last = next(csv.reader([data[start:].decode(errors="replace")]), [])
+    if interrupted or len(last) not in counts:
+        with open(filename, mode="r+b") as file:
+            file.truncate(start)
+        repairs.append(f"removed a partial row from {filename}")
+    else: # terminate it so the next append starts a new row
+        with open(filename, mode="ab") as file:
+            file.write(b"\r\n")
+        repairs.append(f"ended the last row of {filename}")
+    return repairs
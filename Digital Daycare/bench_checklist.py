@@ -0,0 +1,81 @@
+# Micro-benchmark of the activity checklist build time against the number of tasks
+# usage: python bench_checklist.py [task counts...]   (needs a display)
+from assets import AssetCache
+from checklist import CustomCheckbox, VirtualChecklist, ICON_FILES, ICON_SIZE, checkbox_icons
+from task import Task
+from PIL import Image, ImageTk
+import sys, time
+
+import tkinter as tk
+
+TASK_COUNTS = (10, 100, 500, 2000)
+REPEATS = 3 # best of
+
+
+class PerRowCheckbox(CustomCheckbox):
+    """ The old checkbox: every row decodes and resizes its own icons
+    """
+    def __init__(self, master, icons, **kwargs):
+        icons = {name: ImageTk.PhotoImage(Image.open(path).resize(ICON_SIZE), master=master)
+                 for name, path in ICON_FILES.items()}
+        super().__init__(master, icons, **kwargs)
+
+
+def build_all_rows(root, tasks, checkbox_class, icons):
+    """ Build one checkbox per task, as the activity screen did before virtualization
+    Args:
+        root (Tk): the window to build in
+        tasks (list): the Task instances to list
+        checkbox_class (type): CustomCheckbox or PerRowCheckbox
+        icons (dict): the shared checkbox icons
+    """
+    frame = tk.Frame(root)
+    for index, task in enumerate(tasks):
+        checkbox = checkbox_class(frame, icons)
+        checkbox.show(index, task, 0)
+        checkbox.pack(padx=10, pady=15, anchor="w")
+    root.update_idletasks()
+    frame.destroy()
+
+
+def build_virtual(root, tasks, assets):
+    """ Build the virtualized checklist the activity screen uses now
+    Args:
+        root (Tk): the window to build in
+        tasks (list): the Task instances to list
+        assets (AssetCache): the image cache holding the icons
+    """
+    canvas = tk.Canvas(root, width=320, height=240)
+    checklist = VirtualChecklist(canvas, tk.Scrollbar(root), assets)
+    checklist.set_tasks(tasks)
+    root.update_idletasks()
+    canvas.destroy()
+
+
+def best_time(build):
+    """ Returns:
+        the fastest of REPEATS runs of build() in milliseconds
+    """
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        build()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or TASK_COUNTS
+    root = tk.Tk()
+    root.withdraw()
+    assets = AssetCache()
+    icons = checkbox_icons(assets)
+
+    print(f"{'tasks':>7} {'per-row icons':>15} {'shared icons':>14} {'virtualized':>13}   (ms)")
+    for count in counts:
+        tasks = [Task(root, None, None, "10000", str(i), f"activity {i}", i % 2) for i in range(count)]
+        per_row = best_time(lambda: build_all_rows(root, tasks, PerRowCheckbox, icons))
+        shared = best_time(lambda: build_all_rows(root, tasks, CustomCheckbox, icons))
+        virtual = best_time(lambda: build_virtual(root, tasks, assets))
+        print(f"{count:>7} {per_row:>15.1f} {shared:>14.1f} {virtual:>13.1f}")
+    root.destroy()
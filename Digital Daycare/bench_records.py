@@ -0,0 +1,60 @@
+# Memory benchmark of the in-memory task models at reporting scale
+# usage: python bench_records.py [task counts...]
+from records import TaskTable
+from services import TaskRecord
+import sys, tracemalloc
+
+TASK_COUNTS = (1000000,)
+PETS = 1000 # the tasks are spread over this many pets
+
+
+class DictTask:
+    """ The old task record: the four fields plus change tracking, kept in a per-instance __dict__
+    """
+    def __init__(self, pet_id, task_id, description, status):
+        self._pet_id = pet_id
+        self._task_id = task_id
+        self._desc = description
+        self._status = status
+        self.dirty = set()
+
+
+def task_rows(count):
+    """ Args:
+        count (int): number of rows
+    Yields:
+        tasks rows as read from tasks.csv
+    """
+    for i in range(count):
+        yield [str(20000 + i % PETS), str(30000 + i), f"activity {i % 50}", str(i % 2)]
+
+
+def measure(build, count):
+    """ Args:
+        build (callable): builds the model from an iterable of rows
+        count (int): number of tasks
+    Returns:
+        bytes allocated by the built model, excluding the rows themselves
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    model = build(task_rows(count))
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del model
+    return size
+
+
+MODELS = {
+    "dict objects": lambda rows: [DictTask(p, t, d, int(s)) for p, t, d, s in rows],
+    "TaskRecord": lambda rows: [TaskRecord(p, t, d, int(s)) for p, t, d, s in rows],
+    "TaskTable": TaskTable.from_rows,
+}
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or TASK_COUNTS
+    print(f"{'tasks':>9} " + " ".join(f"{name:>14}" for name in MODELS) + "   (MB, bytes/task)")
+    for count in counts:
+        sizes = [measure(build, count) for build in MODELS.values()]
+        print(f"{count:>9} " + " ".join(f"{size / 1e6:>7.1f} {size / count:>6.0f}" for size in sizes))
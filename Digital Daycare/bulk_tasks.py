@@ -0,0 +1,71 @@
+# Bulk task import and streaming export
+# usage: python bulk_tasks.py import <tasks.csv | tasks.json>
+#        python bulk_tasks.py export pet <pet_id>      (csv rows on stdout)
+#        python bulk_tasks.py export user <user_id>
+from services import DaycareService
+from storage import open_storage
+import csv, json, sys
+
+HEADER = ["pet", "description"] # optional first row of an import csv
+
+
+def read_pairs(stream, fmt):
+    """ Parse (pet_id, description) pairs
+    Args:
+        stream (file): the text to import
+        fmt (str): "csv" for pet_id,description rows (HEADER row optional); "json" for an array
+            of {"pet": ..., "description": ...} objects or one such object per line
+    Yields:
+        tuples of pet_id and description
+    Raises:
+        ValueError: for malformed JSON or an item that is not an object, by its position counted from 1
+    """
+    if fmt == "csv":
+        for row in csv.reader(stream):
+            if row and row != HEADER:
+                yield (row[0], row[1] if len(row) > 1 else "")
+        return
+
+    text = stream.read()
+    if text.lstrip().startswith("["):
+        items = json.loads(text)
+    else: # JSON lines
+        items = (json.loads(line) for line in text.splitlines() if line.strip())
+    for index, item in enumerate(items, start=1):
+        if not isinstance(item, dict):
+            raise ValueError(f"invalid tasks\n{index}: not a JSON object: {item!r}")
+        yield (str(item.get("pet", "")), str(item.get("description", "")))
+
+
+def write_csv(rows, stream):
+    """ Write task rows as they are produced
+    Args:
+        rows (iterable): task rows, e.g. from DaycareService.export_tasks
+        stream (file): where the csv goes
+    Returns:
+        number of rows written
+    """
+    writer = csv.writer(stream)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    service = DaycareService(open_storage())
+    if len(sys.argv) == 3 and sys.argv[1] == "import":
+        filename = sys.argv[2]
+        with open(filename, mode="r", newline="") as file:
+            try:
+                rows = service.import_tasks(read_pairs(file, "json" if filename.endswith((".json", ".jsonl")) else "csv"))
+            except ValueError as error:
+                sys.exit(str(error))
+        print(f"Imported {len(rows)} tasks")
+    elif len(sys.argv) == 4 and sys.argv[1:3] == ["export", "pet"]:
+        write_csv(service.export_tasks(pet_id=sys.argv[3]), sys.stdout)
+    elif len(sys.argv) == 4 and sys.argv[1:3] == ["export", "user"]:
+        write_csv(service.export_tasks(user_id=sys.argv[3]), sys.stdout)
+    else:
+        sys.exit("usage: bulk_tasks.py import <file> | export pet <pet_id> | export user <user_id>")
@@ -0,0 +1,170 @@
+import tkinter as tk
+
+ROW_HEIGHT = 60 # px per task row; the 30px icon plus its padding
+ROW_BUFFER = 2 # rows kept ready above and below the view
+ICON_SIZE = (30, 30) # as listed in assets.ASSET_MANIFEST, so the startup warm-up covers them
+ICON_FILES = {"completed": "interfaces/completed.png", "incompleted": "interfaces/incompleted.png",
+              "neutral": "interfaces/neutral.png", "exile": "interfaces/exile.png"}
+
+
+def checkbox_icons(assets):
+    """ Args:
+        assets (AssetCache): the app's image cache
+    Returns:
+        dict of icon name -> PhotoImage, served from the cache
+    """
+    return {name: assets.photo(path, ICON_SIZE) for name, path in ICON_FILES.items()}
+
+
+class CustomCheckbox(tk.Frame):
+    """ Custom-style checkbox to represent the task completion status; rows are recycled by
+    VirtualChecklist, so the task shown and its checked state are set through show()
+    Args:
+        tk (Frame): the Frame instance to build on
+    Attributes:
+        icons (dict): icon name -> PhotoImage, shared by every checkbox of the checklist
+    """
+    def __init__(self, master, icons, removal=False, on_toggle=None, *args, **kwargs):
+        """ Initialize the checkbox widget
+        Args:
+            master (tk.Widget): parent widget
+            icons (dict): icon name -> PhotoImage, see checkbox_icons
+            removal (bool, optional): use the task REMOVAL icons. Defaults to False (COMPLETION status)
+            on_toggle (callable, optional): on_toggle(checkbox) runs when the row is clicked. Defaults to None
+        """
+        super().__init__(master, bg="white", *args, **kwargs)
+
+        self.task = None # the Task shown, set by show()
+        self.index = None # position of the task in the checklist
+        self.on_toggle = on_toggle
+        self.removal = removal
+        self.icons = icons
+
+        self.checklist_picture_label = tk.Label(self, bg="white")
+        self.checklist_picture_label.pack(side="left", padx=5, pady=5)
+
+        self.task_desc_label = tk.Label(self, bg="white", font=("Courier", 12),
+                                        fg="#72615A", width=22, anchor="w", justify="left", wraplength=220)
+        self.task_desc_label.pack(side="left", pady=0)
+
+        self.checklist_picture_label.bind("<Button-1>", self.toggle)
+        self.task_desc_label.bind("<Button-1>", self.toggle)
+
+    def show(self, index, task, checked):
+        """ Display a task in this row
+        Args:
+            index (int): position of the task in the checklist
+            task (Task): the Task instance to refer to
+            checked (int): 1 if the row is checked; otherwise 0
+        """
+        if self.removal: # icon for task REMOVAL
+            unchecked, checked_icon = "neutral", "exile"
+        elif task.status == 1: # current task is active (check=incomplete, uncheck=completed)
+            unchecked, checked_icon = "completed", "incompleted"
+        else:
+            unchecked, checked_icon = "incompleted", "completed"
+
+        self.index = index
+        self.task = task
+        self.checklist_picture_label.config(image=self.icons[checked_icon if checked else unchecked])
+        self.task_desc_label.config(text=task.desc)
+
+    def toggle(self, event=None):
+        """ Toggle checkboxes between check/uncheck
+
+        Args:
+            event (tk.Event, optional): Event object to be accessed. Defaults to None
+        """
+        if self.on_toggle is not None:
+            self.on_toggle(self)
+
+
+class VirtualChecklist:
+    """ Scrollable task checklist that only creates rows for the tasks in view (plus ROW_BUFFER
+    on each side) and moves them to other tasks on scroll; checked states live in a bytearray
+    Attributes:
+        canvas (Canvas): the canvas the rows are drawn on
+        scrollbar (Scrollbar): the scrollbar linked to the canvas
+        removal (bool): whether the rows use the task REMOVAL icons
+        icons (dict): icon name -> PhotoImage for every row
+        tasks (list): the Task instances listed
+        states (bytearray): 1 for every checked task; otherwise 0
+        _rows (list): (CustomCheckbox, canvas window id) pairs created so far
+    """
+    def __init__(self, canvas, scrollbar, assets, removal=False):
+        """ Args:
+            canvas (Canvas): the canvas to draw the rows on
+            scrollbar (Scrollbar): the vertical scrollbar of the canvas
+            assets (AssetCache): the app's image cache, holding the checkbox icons
+            removal (bool, optional): use the task REMOVAL icons. Defaults to False
+        """
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.removal = removal
+        self.icons = checkbox_icons(assets)
+        self.tasks = []
+        self.states = bytearray()
+        self._rows = []
+
+        self.no_tasks_label = tk.Label(canvas, text="No existing activities", bg="white", font=("Courier", 12))
+        self._no_tasks_window = canvas.create_window(50, 30, window=self.no_tasks_label, anchor="nw", state="hidden")
+
+        canvas.configure(yscrollcommand=self._on_scroll, yscrollincrement=ROW_HEIGHT)
+        scrollbar.configure(command=canvas.yview)
+
+    def set_tasks(self, tasks):
+        """ List a new set of tasks, all unchecked, scrolled to the top
+        Args:
+            tasks (list): the Task instances to list
+        """
+        self.tasks = list(tasks)
+        self.states = bytearray(len(self.tasks))
+        self.canvas.itemconfigure(self._no_tasks_window, state="normal" if not self.tasks else "hidden")
+
+        view_height = int(self.canvas.cget("height"))
+        self.canvas.config(scrollregion=(0, 0, int(self.canvas.cget("width")),
+                                         max(view_height, len(self.tasks) * ROW_HEIGHT)))
+        self.canvas.yview_moveto(0)
+        self.render()
+
+    def _on_scroll(self, first, last):
+        """ yscrollcommand of the canvas; keeps the scrollbar in sync and re-renders the rows
+        """
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def render(self):
+        """ Point the row widgets at the tasks currently in view, creating rows only when the
+        view needs more than exist
+        """
+        top = int(self.canvas.canvasy(0))
+        view_height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        first = max(0, top // ROW_HEIGHT - ROW_BUFFER)
+        last = min(len(self.tasks), (top + view_height) // ROW_HEIGHT + 1 + ROW_BUFFER)
+
+        while len(self._rows) < last - first:
+            row = CustomCheckbox(self.canvas, self.icons, removal=self.removal, on_toggle=self.toggle)
+            self._rows.append((row, self.canvas.create_window(10, 0, window=row, anchor="w")))
+
+        for slot, (row, window) in enumerate(self._rows):
+            index = first + slot
+            if index < last:
+                self.canvas.coords(window, 10, index * ROW_HEIGHT + ROW_HEIGHT // 2)
+                self.canvas.itemconfigure(window, state="normal")
+                row.show(index, self.tasks[index], self.states[index])
+            else:
+                self.canvas.itemconfigure(window, state="hidden")
+
+    def toggle(self, row):
+        """ Flip the checked state of the task shown in a row
+        Args:
+            row (CustomCheckbox): the clicked row
+        """
+        self.states[row.index] ^= 1
+        row.show(row.index, row.task, self.states[row.index])
+
+    def selected(self):
+        """ Returns:
+            list of the checked Task instances
+        """
+        return [task for task, checked in zip(self.tasks, self.states) if checked]
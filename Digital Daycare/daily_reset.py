@@ -0,0 +1,118 @@
+# Daily reset of every pet and task in one pass; run at day rollover (the app also runs it on startup)
+# usage: python daily_reset.py
+from atomic_write import write_rows
+from file_lock import lock_for
+from rules import today
+from datetime import date, timedelta
+import csv, os, time
+
+MARKER_FILENAME = "reset_date.csv" # date of the last completed reset
+PET_STATUS, PET_EVENT, PET_DATE = 3, 6, 7 # pets.csv columns
+TASK_STATUS = 3 # tasks.csv column
+
+
+def reset_rows(rows, current):
+    """ Reset status and event of every pets.csv row last saved before the current date, in place.
+    A plain loop: building NumPy arrays from csv rows costs more than the whole reset
+    Args:
+        rows (list): pets.csv rows
+        current (str): today's date
+    Returns:
+        tuple of the new rows and the number of rows reset
+    """
+    count = 0
+    for row in rows:
+        if row[PET_DATE] != current:
+            row[PET_STATUS], row[PET_EVENT], row[PET_DATE] = "1", "0", current
+            count += 1
+    return rows, count
+
+
+def pack_statuses(statuses):
+    """ Args:
+        statuses (iterable): task statuses in task order, 1 for completed
+    Returns:
+        hex str of a bitmap whose bit i is set when task i was completed
+    """
+    bits = 0
+    for index, status in enumerate(statuses):
+        if int(status):
+            bits |= 1 << index
+    return format(bits, "x")
+
+
+def unpack_statuses(bits, count):
+    """ Args:
+        bits (str): hex bitmap from pack_statuses
+        count (int): number of tasks packed
+    Returns:
+        list of the task statuses in task order
+    """
+    value = int(bits, 16)
+    return [(value >> index) & 1 for index in range(count)]
+
+
+def archive_rows(groups, day):
+    """ Args:
+        groups (dict): pet_id -> the pet's tasks.csv rows
+        day (str): the day the statuses belong to
+    Returns:
+        one history row per pet: pet_id, day, task count and packed statuses
+    """
+    return [[pet_id, day, len(rows), pack_statuses(row[TASK_STATUS] for row in rows)]
+            for pet_id, rows in groups.items() if rows]
+
+
+def clear_statuses(rows):
+    """ Mark every tasks.csv row incomplete, in place
+    Args:
+        rows (list): tasks.csv rows
+    Returns:
+        tuple of the rows and the number of rows changed
+    """
+    count = 0
+    for row in rows:
+        if row[TASK_STATUS] != "0":
+            row[TASK_STATUS] = "0"
+            count += 1
+    return rows, count
+
+
+def last_reset():
+    """ Returns:
+        the date of the last completed reset, None if it never ran
+    """
+    if not os.path.exists(MARKER_FILENAME):
+        return None
+    with open(MARKER_FILENAME, mode="r", newline="") as file:
+        row = next(csv.reader(file), None)
+    return row[0] if row else None
+
+
+def run_reset(storage, current=None):
+    """ Archive the last day's task completion to the history and clear it, reset every pet not
+    saved today and stamp the marker, after which pet loading skips its per-row date check for
+    the rest of the day. The whole reset holds the marker's lock, so when several instances start
+    on the same day only the first one resets and the others find the marker already stamped
+    Args:
+        storage (Storage): the backend holding the pets
+        current (str, optional): today's date. Defaults to rules.today()
+    Returns:
+        number of pets reset, 0 if the reset already ran today
+    """
+    current = current or today()
+    with lock_for(MARKER_FILENAME):
+        day = last_reset() or str(date.fromisoformat(current) - timedelta(days=1))
+        if day == current: # another instance got here first
+            return 0
+        storage.rollover_tasks(day)
+        count = storage.reset_pets(current)
+        write_rows(MARKER_FILENAME, [[current]])
+    return count
+
+
+if __name__ == "__main__":
+    from storage import open_storage
+    start = time.perf_counter()
+    count = run_reset(open_storage())
+    print(f"Reset {count} pets in {(time.perf_counter() - start) * 1000:.1f} ms")
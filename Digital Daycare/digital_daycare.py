@@ -1,27 +1,37 @@
 import tkinter as tk
-from PIL import Image, ImageTk
 from account_manager import AccountManager
+from storage import open_storage
+from services import DaycareService
+from daily_reset import last_reset, run_reset
+from rules import today
+from persistence import PersistenceScheduler
+from assets import AssetCache
+from screens import ScreenManager
+
+DAY_CHECK_INTERVAL = 60000 # ms between checks whether the date has changed
 
 
 class App:
     """ The main application class for the program; initializes main GUI window
     """
-    def __init__(self, root):
+    def __init__(self, root, preload=True):
         """ Intialize the App with the main Tkinter window
 
         Args:
             root (Tk): the instance serving as the main application window
+            preload (bool, optional): warm up every screen's images in the background. Defaults to True
         """
         # WINDOW CREATION
         self.root = root
         self.root.title("Digital Daycare")
         
-        self.bg_image = Image.open("interfaces/start.png")
-        self.bg_width, self.bg_height = self.bg_image.size
-        self.bg_photo = ImageTk.PhotoImage(self.bg_image)
+        self.assets = AssetCache()
+        self.bg_photo = self.assets.photo("interfaces/start.png")
+        self.bg_width, self.bg_height = self.bg_photo.width(), self.bg_photo.height()
         
         self.root.geometry(f"{self.bg_width}x{self.bg_height}")
         self.root.resizable(False, False)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
                 
         # PERMANENT BANNER CREATION
         self.banner_frame = tk.Frame(self.root, bg="#72615A")
@@ -36,21 +46,39 @@ class App:
         self.frame.pack(fill="both", expand=True)
         
         # PREPROCESSES        
+        self.screens = ScreenManager(self.frame)
+        self.storage = open_storage()
+        self.service = DaycareService(self.storage)
+        self.day = today()
+        if last_reset() != self.day: # first start of the day; reset every pet at once
+            run_reset(self.storage, self.day)
+        self.scheduler = PersistenceScheduler(self.root)
         self._manager = AccountManager(self.root, self.frame, self)        
         self.setup_main_screen()        
+        self.root.after(DAY_CHECK_INTERVAL, self.check_day) # a session may stay open past midnight
+        
+        # start screen is up; decode the rest while the user looks at it
+        if preload:
+            self.assets.preload(self.root)
     
     def setup_main_screen(self):
         """ Display the starter screen of the application
         """
-        self.bg_label = tk.Label(self.frame, image=self.bg_photo) #reload bg label
+        self.screens.show(self, "main", self.build_main_screen)
+
+    def build_main_screen(self, screen):
+        """ Create the widgets of the starter screen
+        Args:
+            screen (Frame): the frame the screen is built in
+        """
+        self.bg_label = tk.Label(screen, image=self.bg_photo)
         self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
 
         # SIGN IN button        
-        self.start_img = Image.open("interfaces/log_in.png").resize((280, 95))  #load img
-        self.start_photo = ImageTk.PhotoImage(self.start_img)
+        self.start_photo = self.assets.photo("interfaces/log_in.png", (280, 95))
         
         self.start_button = tk.Button(
-            self.frame,
+            screen,
             image=self.start_photo,
             command=self._manager.open_login_screen,
             borderwidth=0,
@@ -62,11 +90,10 @@ class App:
         self.start_button.place(relx=0.5, rely=0.60, anchor="center")
         
         # NEW ACCOUNT button
-        self.new_account_button_img = Image.open("interfaces/new_account_button.png").resize((165, 38))
-        self.new_acc_photo = ImageTk.PhotoImage(self.new_account_button_img)
+        self.new_acc_photo = self.assets.photo("interfaces/new_account_button.png", (165, 38))
         
         self.new_account_button = tk.Button(
-            self.frame,
+            screen,
             image=self.new_acc_photo,
             command= self._manager.open_new_acc_screen,
             borderwidth=0,
@@ -78,11 +105,10 @@ class App:
         self.new_account_button.place(relx=0.5, rely=0.71, anchor="center")    
         
         # SETTING button
-        self.setting_icon_img = Image.open("interfaces/setting_icon.png").resize((45, 40))
-        self.setting_icon_photo = ImageTk.PhotoImage(self.setting_icon_img)
+        self.setting_icon_photo = self.assets.photo("interfaces/setting_icon.png", (45, 40))
         
         self.setting_button = tk.Button(
-            self.frame,
+            screen,
             image=self.setting_icon_photo,
             command= self._manager.open_setting_screen,
             borderwidth=0,
@@ -93,19 +119,32 @@ class App:
         )
         self.setting_button.place(relx=0.08, rely=0.05, anchor="center")
 
+    def check_day(self):
+        """ Run the daily reset when the date changes during a session, then check again later.
+        The day's pending changes are saved first so the reset archives them; the session then
+        returns to the main screen and every account reads its reset pets again on the next visit
+        """
+        current = today()
+        if current != self.day:
+            self.day = current
+            self.scheduler.flush()
+            run_reset(self.storage, current) # skipped if another instance reset already
+            self.setup_main_screen()
+            self._manager.start_new_day()
+        self.root.after(DAY_CHECK_INTERVAL, self.check_day)
+
     def back_to_main(self):
         """ Reload the starting screen for the app
         """
-        # clears current screen, remove all widgets
-        for widget in self.frame.winfo_children():
-            widget.destroy()
-
-        # reset background
-        self.bg_label = tk.Label(self.frame, image=self.bg_photo)
-        self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-                
+        self.scheduler.flush() # logging out saves everything pending
         self.setup_main_screen()
 
+    def close(self):
+        """ Save pending changes before the window closes
+        """
+        self.scheduler.flush()
+        self.root.destroy()
+
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,87 @@
+import time
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_SUFFIX = ".lock"
+RETRY_DELAY = 0.005 # s between attempts where only a non-blocking lock exists (Windows)
+
+_locks = {} # data file -> FileLock, one per file and process
+
+
+class FileLock:
+    """ Advisory lock held around a read-modify-write cycle of a data file, so processes sharing
+    the working directory never write over each other's changes. The lock is taken on a separate
+    .lock file because atomic rewrites replace the data file itself. Reentrant within a process
+    Attributes:
+        path (str): the lock file
+        acquired (int): number of times the lock was taken
+        wait_time (float): seconds spent waiting for other processes in total
+        max_wait (float): longest single wait in seconds
+        _depth (int): nesting level of the current holder
+        _file (file): the open lock file while held
+    """
+    def __init__(self, filename):
+        """ Args:
+            filename (str): the data file to guard
+        """
+        self.path = filename + LOCK_SUFFIX
+        self.acquired = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        if self._depth == 0:
+            start = time.perf_counter()
+            self._file = open(self.path, mode="a+b")
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            else:
+                while True:
+                    try:
+                        self._file.seek(0)
+                        msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(RETRY_DELAY)
+            waited = time.perf_counter() - start
+            self.acquired += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            self._file.close()
+            self._file = None
+
+
+def lock_for(filename):
+    """ Args:
+        filename (str): the data file to guard
+    Returns:
+        the FileLock of that file
+    """
+    lock = _locks.get(filename)
+    if lock is None:
+        lock = _locks[filename] = FileLock(filename)
+    return lock
+
+
+def lock_stats():
+    """ Returns:
+        dict of data file -> (times acquired, total wait in s, longest wait in s)
+    """
+    return {filename: (lock.acquired, lock.wait_time, lock.max_wait) for filename, lock in _locks.items()}
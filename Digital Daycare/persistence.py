@@ -0,0 +1,64 @@
+FLUSH_DELAY = 2000 # ms to wait for more changes before writing
+
+
+class PersistenceScheduler:
+    """ Write-behind saving for pet and task state; mutations only mark their owner as pending
+    and a single flush writes each pending account's pets and pet's tasks once
+    Attributes:
+        root (Tk): the Tkinter window used to schedule flushes, None to only flush explicitly
+        delay (int): milliseconds between the first pending change and the flush
+        _accounts (dict): accounts with unsaved pet changes, keyed by object id
+        _pets (dict): pets with unsaved task changes, keyed by object id
+        _after_id (str): id of the scheduled flush, None when nothing is scheduled
+        flush_count (int): number of flushes that wrote something
+    """
+    def __init__(self, root=None, delay=FLUSH_DELAY):
+        """ Initialize the scheduler
+        Args:
+            root (Tk, optional): the Tkinter window to schedule flushes on. Defaults to None
+            delay (int, optional): milliseconds to wait before flushing. Defaults to FLUSH_DELAY
+        """
+        self.root = root
+        self.delay = delay
+        self._accounts = {}
+        self._pets = {}
+        self._after_id = None
+        self.flush_count = 0
+
+    def save_pets_later(self, account):
+        """ Queue an account whose pets have unsaved changes
+        Args:
+            account (Account): the Account instance to save
+        """
+        self._accounts[id(account)] = account
+        self._schedule()
+
+    def save_tasks_later(self, pet):
+        """ Queue a pet whose tasks have unsaved changes
+        Args:
+            pet (Pet): the Pet instance to save
+        """
+        self._pets[id(pet)] = pet
+        self._schedule()
+
+    def _schedule(self):
+        """ Start the flush timer unless one is already running
+        """
+        if self.root is not None and self._after_id is None:
+            self._after_id = self.root.after(self.delay, self.flush)
+
+    def flush(self):
+        """ Write every pending change now
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+        accounts, pets = self._accounts, self._pets
+        self._accounts, self._pets = {}, {}
+        for account in accounts.values():
+            account.save_pets()
+        for pet in pets.values():
+            pet.save_tasks()
+        if accounts or pets:
+            self.flush_count += 1
@@ -0,0 +1,88 @@
+# Column-wise task storage for loading whole datasets (reports, batch jobs); the app itself keeps
+# using the TaskRecord objects of services.py
+from array import array
+
+ID_TYPECODE = "q" # ids are numeric strings that keep growing past 99999
+
+
+class TaskTable:
+    """ Tasks stored by column instead of one object per task: ids in int arrays, statuses in a
+    bytearray and descriptions in a list, so a million tasks take a few machine words each and
+    bulk operations on statuses run over contiguous bytes
+    Attributes:
+        pet_ids (array): id of each task's pet
+        task_ids (array): id of each task
+        statuses (bytearray): each task's status, 1 for completed
+        descriptions (list): each task's description
+    """
+    def __init__(self):
+        self.pet_ids = array(ID_TYPECODE)
+        self.task_ids = array(ID_TYPECODE)
+        self.statuses = bytearray()
+        self.descriptions = []
+
+    @classmethod
+    def from_rows(cls, rows):
+        """ Args:
+            rows (iterable): tasks rows
+        Returns:
+            the table holding every row, in order
+        """
+        table = cls()
+        for row in rows:
+            table.append(row)
+        return table
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def append(self, row):
+        """ Args:
+            row (list): a tasks row
+        """
+        pet_id, task_id, description, status = row
+        self.pet_ids.append(int(pet_id))
+        self.task_ids.append(int(task_id))
+        self.statuses.append(int(status))
+        self.descriptions.append(description)
+
+    def row(self, index):
+        """ Args:
+            index (int): position of the task
+        Returns:
+            the task as a tasks row
+        """
+        return [str(self.pet_ids[index]), str(self.task_ids[index]), self.descriptions[index],
+                self.statuses[index]]
+
+    def rows(self):
+        """ Yields:
+            every task as a tasks row, in order
+        """
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def completed(self):
+        """ Returns:
+            number of completed tasks
+        """
+        return self.statuses.count(1)
+
+    def clear_statuses(self):
+        """ Mark every task incomplete
+        Returns:
+            number of tasks changed
+        """
+        count = self.completed()
+        self.statuses[:] = bytes(len(self.statuses))
+        return count
+
+    def counts_by_pet(self):
+        """ Returns:
+            dict of pet_id -> (completed, total) tasks
+        """
+        counts = {}
+        for pet_id, status in zip(self.pet_ids, self.statuses):
+            completed, total = counts.get(pet_id, (0, 0))
+            counts[pet_id] = (completed + status, total + 1)
+        return {str(pet_id): pair for pet_id, pair in counts.items()}
@@ -0,0 +1,92 @@
+from datetime import date
+from math import ceil
+
+MIN_STATUS = 1
+MAX_STATUS = 5
+STATUS_TEXT = {1: "exhausted", 2: "tired", 3: "fine", 4: "happy", 5: "elated"}
+
+
+def clamp_status(status):
+    """ Args:
+        status (int): a mood that may have left the scale
+    Returns:
+        the status limited to MIN_STATUS-MAX_STATUS
+    """
+    return max(MIN_STATUS, min(status, MAX_STATUS))
+
+
+def task_status(completed, total):
+    """ Mood earned by the day's activities: the completed share scaled to the status range
+    Args:
+        completed (int): number of completed tasks
+        total (int): number of tasks
+    Returns:
+        the status, MIN_STATUS for a pet without tasks
+    """
+    if total == 0:
+        return MIN_STATUS
+    return clamp_status(ceil(completed / total * MAX_STATUS))
+
+
+class TaskCounts:
+    """ Running totals of a pet's tasks, updated on every add, removal and status change so
+    the task mood never needs a pass over the tasks
+    Attributes:
+        total (int): number of tasks
+        completed (int): number of completed tasks
+    """
+    __slots__ = ("total", "completed")
+
+    def __init__(self, statuses=()):
+        """ Args:
+            statuses (iterable, optional): statuses of the tasks already there. Defaults to none
+        """
+        self.total = 0
+        self.completed = 0
+        for status in statuses:
+            self.add(status)
+
+    def add(self, status):
+        """ Args:
+            status (int): status of the added task, 1 for completed
+        """
+        self.total += 1
+        self.completed += status == 1
+
+    def remove(self, status):
+        """ Args:
+            status (int): status of the removed task
+        """
+        self.total -= 1
+        self.completed -= status == 1
+
+    def change(self, old, new):
+        """ Args:
+            old (int): the task's previous status
+            new (int): the task's new status
+        """
+        self.completed += (new == 1) - (old == 1)
+
+    def mood(self):
+        """ Returns:
+            the task mood of these counts, see task_status
+        """
+        return task_status(self.completed, self.total)
+
+
+def today():
+    """ Returns:
+        today's date as stored in the last_date column
+    """
+    return str(date.today())
+
+
+def is_new_day(last_date, current=None):
+    """ Whether a pet last saved on last_date is due its daily reset (mood and event)
+    Args:
+        last_date (str): the pet's last_date column
+        current (str, optional): the date to compare with. Defaults to today()
+    Returns:
+        True if the dates differ
+    """
+    return last_date != (current or today())
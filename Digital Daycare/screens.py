@@ -0,0 +1,63 @@
+import tkinter as tk
+
+
+class ScreenManager:
+    """ Keeps every screen alive for the session: a screen is built once in its own frame and
+    later visits only raise it and refresh its data-bound widgets
+    Attributes:
+        frame (Frame): the body frame every screen is stacked in
+        _screens (dict): (owner, name) -> screen Frame
+        _hide_callbacks (dict): (owner, name) -> callback run when the screen is covered
+        current (tuple): (owner, name) of the raised screen, None before the first one
+    """
+    def __init__(self, frame):
+        """ Args:
+            frame (Frame): the body frame every screen is stacked in
+        """
+        self.frame = frame
+        self._screens = {}
+        self._hide_callbacks = {}
+        self.current = None
+
+    def show(self, owner, name, build, refresh=None, hide=None):
+        """ Raise a screen, building it on first use
+        Args:
+            owner (object): the App, AccountManager, Account or Pet the screen belongs to
+            name (str): name of the screen within its owner
+            build (callable): build(screen) creates the widgets inside the screen frame
+            refresh (callable, optional): updates data-bound widgets on every visit. Defaults to None
+            hide (callable, optional): runs when another screen is raised over it. Defaults to None
+        Returns:
+            the screen Frame
+        """
+        key = (owner, name)
+        if self.current is not None and self.current != key:
+            callback = self._hide_callbacks.get(self.current)
+            if callback is not None:
+                callback()
+
+        screen = self._screens.get(key)
+        if screen is None:
+            screen = tk.Frame(self.frame)
+            screen.place(x=0, y=0, relwidth=1, relheight=1)
+            build(screen)
+            self._screens[key] = screen
+        if hide is not None:
+            self._hide_callbacks[key] = hide
+
+        self.current = key
+        screen.tkraise()
+        if refresh is not None:
+            refresh()
+        return screen
+
+    def discard(self, owner):
+        """ Destroy every screen of an owner, e.g. once its account or pet is deleted
+        Args:
+            owner (object): the owner whose screens are dropped
+        """
+        for key in [key for key in self._screens if key[0] is owner]:
+            self._screens.pop(key).destroy()
+            self._hide_callbacks.pop(key, None)
+            if self.current == key:
+                self.current = None
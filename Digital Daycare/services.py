@@ -0,0 +1,489 @@
+from daily_reset import last_reset, unpack_statuses
+from event import Event
+from records import TaskTable
+from rules import MIN_STATUS, TaskCounts, clamp_status, is_new_day, today
+import random
+
+DESC_CHANGED, STATUS_CHANGED = 1, 2 # bits of TaskRecord.dirty
+
+
+class AccountRecord:
+    """ An account holder, free of any widget; the GUI and text Account extend it
+    Attributes:
+        _username (str): unique username of the account holder
+        _user_id (str): unique 5-digit id of the account
+        last_active (str): date of the last login, "" if unknown
+    """
+    __slots__ = ("_username", "_user_id", "last_active")
+
+    def __init__(self, username, user_id, last_active=""):
+        """ Args:
+            username (str): unique username of the account holder
+            user_id (str): unique 5-digit id of the account
+            last_active (str, optional): date of the last login. Defaults to unknown
+        """
+        self._username = username
+        self._user_id = user_id
+        self.last_active = last_active
+
+    @property
+    def username(self):
+        return self._username
+
+    @property
+    def user_id(self):
+        return self._user_id
+
+
+class TaskRecord:
+    """ An activity of a pet, free of any widget; the GUI Task extends it
+    Attributes:
+        _pet_id (str): unique 5-digit id of the pet
+        _task_id (str): unique 5-digit id of the task
+        _desc (str): the task's text description
+        _status (int): the task's completion status; 1 for completed, 0 otherwise
+        dirty (int): DESC_CHANGED/STATUS_CHANGED bits of the fields changed since the task was
+            last saved; an int instead of a set keeps a million loaded tasks small
+    """
+    __slots__ = ("_pet_id", "_task_id", "_desc", "_status", "dirty")
+
+    def __init__(self, pet_id, task_id, description, status):
+        """ Args:
+            pet_id (str): unique 5-digit id of the pet
+            task_id (str): unique 5-digit id of the task
+            description (str): the textual description of the task
+            status (int): task status; 1 for completed, 0 for not completed
+        """
+        self._pet_id = pet_id
+        self._desc = description
+        self._status = status
+        self._task_id = task_id
+        self.dirty = 0
+
+    @property
+    def task_id(self):
+        return self._task_id
+
+    @property
+    def desc(self):
+        return self._desc
+
+    @desc.setter
+    def desc(self, new_desc):
+        if new_desc != self._desc:
+            self._desc = new_desc
+            self.dirty |= DESC_CHANGED
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, new_status):
+        if new_status != self._status:
+            self._status = new_status
+            self.dirty |= STATUS_CHANGED
+
+    def row(self):
+        """ Returns:
+            the task as a tasks.csv row
+        """
+        return [self._pet_id, self._task_id, self._desc, self._status]
+
+
+class PetRecord:
+    """ A pet and its activities, free of any widget; the GUI Pet extends it
+    Attributes:
+        _name (str): Name of the pet
+        _pet_id (str): Unique 5-digit ID of the pet
+        _status (int): Current status of the pet (1-5)
+        _species (int): Encoded species type of the pet
+        _animal_id (int): Encoded specific animal chosen
+        _event (int): Current status of event's completion for the day
+        _tasks (list): the pet's tasks, None until loaded
+        _tasks_changed (bool): whether tasks were removed since the last save
+        counts (TaskCounts): total and completed tasks, kept in step with _tasks
+        dirty (set): names of the pet fields changed since the pet was last saved
+    """
+    __slots__ = ("_name", "_pet_id", "_status", "_species", "_animal_id", "_event", "_tasks",
+                 "_tasks_changed", "counts", "dirty")
+
+    def __init__(self, name, pet_id, status, species, animal_id, event):
+        """ Args:
+            name (str): The pet's name
+            pet_id (str): Unique 5-digit id
+            status (str): The current status of the pet (1-5)
+            species (str): Encoded species code of the pet
+            animal_id (str): Encoded animal type code
+            event (str): Current status of event's completion for the day
+        """
+        self._name = name
+        self._pet_id = pet_id
+        self._status = int(status)
+        self._species = int(species)
+        self._animal_id = int(animal_id)
+        self._event = int(event)
+        self._tasks = None
+        self._tasks_changed = False
+        self.counts = TaskCounts()
+        self.dirty = set()
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        self._name = name
+
+    @property
+    def pet_id(self):
+        return self._pet_id
+
+    @property
+    def species(self):
+        return self._species
+
+    @property
+    def animal_id(self):
+        return self._animal_id
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, new_status):
+        if new_status != self._status:
+            self._status = new_status
+            self.changed("status")
+
+    @property
+    def event(self):
+        return self._event
+
+    @event.setter
+    def event(self, new_event):
+        if new_event != self._event:
+            self._event = new_event
+            self.changed("event")
+
+    @property
+    def tasks(self):
+        return self._tasks
+
+    def changed(self, field):
+        """ Record a field that must be saved; the GUI also schedules the save
+        Args:
+            field (str): name of the changed field
+        """
+        self.dirty.add(field)
+
+    def reset_day(self):
+        """ A new day: mood and event attempt start over
+        """
+        self.status = 1
+        self.event = 0
+        self.changed("last_date")
+
+    def set_tasks(self, tasks):
+        """ Args:
+            tasks (list): the pet's loaded tasks
+        """
+        self._tasks = tasks
+        self.counts = TaskCounts(task.status for task in tasks)
+
+    def add_task(self, task):
+        """ Args:
+            task (TaskRecord): a new task of the pet
+        """
+        self._tasks.append(task)
+        self.counts.add(task.status)
+
+    def set_task_status(self, task, status):
+        """ Args:
+            task (TaskRecord): one of the pet's tasks
+            status (int): 1 for completed, 0 otherwise
+        """
+        self.counts.change(task.status, status)
+        task.status = status
+
+    def task_mood(self):
+        """ Returns:
+            the status earned by the completed share of today's tasks, from the running counts
+        """
+        return self.counts.mood()
+
+    def toggle_tasks(self, tasks):
+        """ Mark completed tasks incomplete and the others completed
+        Args:
+            tasks (list): the tasks to flip
+        """
+        for task in tasks:
+            self.set_task_status(task, 0 if task.status == 1 else 1)
+
+    def remove_tasks(self, tasks):
+        """ Args:
+            tasks (list): the tasks to drop; saved with the next task save
+        """
+        removed = set(map(id, tasks))
+        kept = []
+        for task in self._tasks:
+            if id(task) in removed:
+                self.counts.remove(task.status)
+            else:
+                kept.append(task)
+        self._tasks = kept
+        self._tasks_changed = True
+
+    def attend_event(self):
+        """ Run today's random event: a gain raises the mood by one, anything else lowers it
+        Returns:
+            tuple of the event's result and prompt, None if an event was attended today already
+        """
+        if self._event != 0:
+            return None
+        event = Event()
+        result, prompt = random.choice((event.park, event.swim, event.bake))()
+        self.status = clamp_status(self._status + (1 if result > 0 else -1))
+        self.event = 1
+        return (result, prompt)
+
+    def row(self, user_id, last_date):
+        """ Args:
+            user_id (str): id of the owning account
+            last_date (str): date the row is saved on
+        Returns:
+            the pet as a pets.csv row
+        """
+        return [user_id, self._name, self._pet_id, self._status, self._species, self._animal_id,
+                self._event, last_date]
+
+
+class DaycareService:
+    """ Account, pet and task operations on top of a Storage backend with no Tk dependency; the
+    GUI calls into it and batch jobs or worker processes can use it on their own
+    Attributes:
+        storage (Storage): where user, pet and task records are kept
+    """
+    def __init__(self, storage):
+        """ Args:
+            storage (Storage): where user, pet and task records are kept
+        """
+        self.storage = storage
+
+    def users(self, factory=AccountRecord):
+        """ Args:
+            factory (callable, optional): builds an account from username, user_id and last_active.
+                Defaults to AccountRecord
+        Returns:
+            list of accounts in creation order
+        """
+        return [factory(username, user_id, last_active) for username, user_id, last_active in self.storage.read_users()]
+
+    def create_user(self, username):
+        """ Args:
+            username (str): the new account's unique username
+        Returns:
+            the new user id
+        """
+        user_id = self.storage.next_id("user")
+        self.storage.add_user(username, user_id, today())
+        return user_id
+
+    def touch_user(self, user_id, last_active, current=None):
+        """ Record a login; an account is written at most once a day
+        Args:
+            user_id (str): the account logging in
+            last_active (str): the account's recorded last_active
+            current (str, optional): today's date. Defaults to rules.today()
+        Returns:
+            the account's new last_active
+        """
+        current = current or today()
+        if last_active != current:
+            self.storage.mark_active([user_id], current)
+        return current
+
+    def delete_user(self, user_id):
+        """ Delete an account with every pet, task and history it owns
+        Args:
+            user_id (str): the account to delete
+        """
+        self.delete_users([user_id])
+
+    def delete_users(self, user_ids):
+        """ Delete accounts with everything they own; N accounts cost the same writes as one
+        Args:
+            user_ids (iterable): the accounts to delete
+        """
+        self.storage.delete_accounts(user_ids)
+
+    def load_pets(self, user_id, factory=PetRecord, current=None):
+        """ Read an account's pets; pets last saved on an earlier day get their daily reset, unless
+        the bulk reset (daily_reset.py) already ran today and no row can be out of date
+        Args:
+            user_id (str): the owning account
+            factory (callable, optional): builds a pet from name, pet_id, status, species, animal_id
+                and event. Defaults to PetRecord
+            current (str, optional): today's date. Defaults to rules.today()
+        Returns:
+            list of pets
+        """
+        current = current or today()
+        check_dates = last_reset() != current
+        pets = []
+        for read_user_id, name, pet_id, status, species, animal_id, event, last_date in self.storage.read_pets(user_id):
+            pet = factory(name, pet_id, status, species, animal_id, event)
+            if check_dates and is_new_day(last_date, current):
+                pet.reset_day()
+            pets.append(pet)
+        return pets
+
+    def create_pet(self, user_id, name, animal_id, factory=PetRecord, species=None, status=MIN_STATUS):
+        """ Args:
+            user_id (str): the owning account
+            name (str): the pet's name
+            animal_id (int): the chosen animal; ids below 4 are domestic, the rest dinosaurs
+            factory (callable, optional): builds the pet. Defaults to PetRecord
+            species (int, optional): the pet's species. Defaults to the one of the animal
+            status (int, optional): the pet's starting mood. Defaults to MIN_STATUS
+        Returns:
+            the new pet, already saved
+        """
+        if species is None:
+            species = 1 if animal_id < 4 else 2
+        pet = factory(name, self.storage.next_id("pet"), status, species, animal_id, 0)
+        pet.set_tasks([])
+        self.storage.add_pet(pet.row(user_id, today()))
+        return pet
+
+    def save_pets(self, user_id, pets):
+        """ Write an account's pets if any of them changed
+        Args:
+            user_id (str): the owning account
+            pets (list): every pet of the account
+        Returns:
+            True if the pets were written
+        """
+        if not any(pet.dirty for pet in pets):
+            return False
+        current = today()
+        self.storage.write_pets(user_id, [pet.row(user_id, current) for pet in pets])
+        for pet in pets:
+            pet.dirty.clear()
+        return True
+
+    def delete_pet(self, pet_id):
+        """ Delete a pet with its tasks and history
+        Args:
+            pet_id (str): the pet to delete
+        """
+        self.delete_pets([pet_id])
+
+    def delete_pets(self, pet_ids):
+        """ Delete pets with their tasks and history; N pets cost the same writes as one
+        Args:
+            pet_ids (iterable): the pets to delete
+        """
+        self.storage.delete_pets(pet_ids)
+
+    def completion_history(self, pet_id):
+        """ Args:
+            pet_id (str): the pet to look up
+        Returns:
+            dict of day -> the task statuses archived for that day, oldest first
+        """
+        return {day: unpack_statuses(bits, int(count))
+                for read_pet_id, day, count, bits in self.storage.read_history(pet_id)}
+
+    def load_tasks(self, pet_id, factory=TaskRecord):
+        """ Args:
+            pet_id (str): the owning pet
+            factory (callable, optional): builds a task from pet_id, task_id, description and
+                status. Defaults to TaskRecord
+        Returns:
+            list of the pet's tasks
+        """
+        return [factory(pet_id, task_id, description, int(status))
+                for read_pet_id, task_id, description, status in self.storage.read_tasks(pet_id)]
+
+    def create_task(self, pet, description, factory=TaskRecord):
+        """ Args:
+            pet (PetRecord): the owning pet, with its tasks loaded
+            description (str): the activity
+            factory (callable, optional): builds the task. Defaults to TaskRecord
+        Returns:
+            the new task, already saved and added to the pet
+        """
+        task = factory(pet.pet_id, self.storage.next_id("task"), description, 0)
+        self.storage.add_task(task.row())
+        pet.add_task(task)
+        return task
+
+    def import_tasks(self, pairs):
+        """ Add many tasks at once: every pair is validated first, the ids are allocated in one
+        batch and all tasks are saved in a single write; nothing is saved if any pair is invalid
+        Args:
+            pairs (iterable): (pet_id, description) pairs
+        Returns:
+            list of the new task rows
+        Raises:
+            ValueError: listing every invalid pair by its position, counted from 1
+        """
+        pairs = [(str(pet_id), description.strip()) for pet_id, description in pairs]
+        known = self.storage.pet_ids()
+        errors = []
+        for index, (pet_id, description) in enumerate(pairs, start=1):
+            if pet_id not in known:
+                errors.append(f"{index}: unknown pet {pet_id!r}")
+            elif not description:
+                errors.append(f"{index}: empty description")
+        if errors:
+            raise ValueError("invalid tasks\n" + "\n".join(errors))
+        if not pairs:
+            return []
+
+        task_ids = self.storage.next_ids("task", len(pairs))
+        rows = [[pet_id, task_id, description, 0] for (pet_id, description), task_id in zip(pairs, task_ids)]
+        self.storage.add_tasks(rows)
+        return rows
+
+    def export_tasks(self, pet_id=None, user_id=None):
+        """ Stream the tasks of a pet or of every pet of an account
+        Args:
+            pet_id (str, optional): the pet to export
+            user_id (str, optional): the account to export, used when no pet_id is given
+        Returns:
+            generator of task rows
+        """
+        pet_ids = [pet_id] if pet_id is not None else [row[2] for row in self.storage.read_pets(user_id)]
+        return self.storage.iter_tasks(pet_ids)
+
+    def task_table(self, pet_ids=None):
+        """ Load tasks into one compact TaskTable for reports and bulk operations
+        Args:
+            pet_ids (iterable, optional): the pets whose tasks to load. Defaults to every pet
+        Returns:
+            the TaskTable
+        """
+        if pet_ids is None:
+            pet_ids = sorted(self.storage.pet_ids())
+        return TaskTable.from_rows(self.storage.iter_tasks(pet_ids))
+
+    def save_tasks(self, pet):
+        """ Write a pet's tasks if any task changed or was removed
+        Args:
+            pet (PetRecord): the pet to save
+        Returns:
+            True if the tasks were written
+        """
+        if pet._tasks is None:
+            return False
+        if not pet._tasks_changed and not any(task.dirty for task in pet._tasks):
+            return False
+        self.storage.write_tasks(pet.pet_id, [task.row() for task in pet._tasks])
+        pet._tasks_changed = False
+        for task in pet._tasks:
+            task.dirty = 0
+        return True
@@ -0,0 +1,690 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from atomic_write import append_row, append_rows, recover_files, write_rows
+from daily_reset import MARKER_FILENAME, archive_rows, clear_statuses, reset_rows
+from file_lock import lock_for
+from journal import Journal
+import csv, os, sqlite3
+
+ACC_FILENAME = "users.csv"
+PETS_FILENAME = "pets.csv"
+TASK_FILENAME = "tasks.csv"
+DB_FILENAME = "daycare.db"
+IDS_FILENAME = "ids.csv"
+HISTORY_FILENAME = "history.csv" # pet_id, day, task count, packed task statuses
+FIRST_ID = 10000 # ids start at 5 digits and keep growing past 99999
+
+# kind -> (csv file, column) and (table, column) holding the ids a new counter must start after
+ID_SOURCES = {"user": (ACC_FILENAME, 1), "pet": (PETS_FILENAME, 2), "task": (TASK_FILENAME, 1)}
+ID_COLUMNS = {"user": ("users", "user_id"), "pet": ("pets", "pet_id"), "task": ("tasks", "task_id")}
+# numbers of values of a complete row in each file checked for interrupted writes on startup
+CSV_COLUMNS = {ACC_FILENAME: (2, 3), PETS_FILENAME: (8,), TASK_FILENAME: (4,), IDS_FILENAME: (2,),
+               MARKER_FILENAME: (1,), HISTORY_FILENAME: (4,)} # users.csv rows from before last_active have 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    last_active TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS pets (
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    pet_id TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    species INTEGER NOT NULL,
+    animal_id INTEGER NOT NULL,
+    event INTEGER NOT NULL,
+    last_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pets_user_id ON pets (user_id);
+CREATE INDEX IF NOT EXISTS pets_pet_id ON pets (pet_id);
+CREATE TABLE IF NOT EXISTS tasks (
+    pet_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    description TEXT NOT NULL,
+    status INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_pet_id ON tasks (pet_id);
+CREATE TABLE IF NOT EXISTS history (
+    pet_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    bits TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_pet_id ON history (pet_id);
+CREATE TABLE IF NOT EXISTS ids (
+    kind TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);
+"""
+
+
+class Storage(ABC):
+    """ Persistence layer shared by AccountManager, Account and Pet
+    Rows are passed around as lists in the same column order as the csv files:
+        users: username, user_id, last_active ("" for accounts not seen since it was added)
+        pets: user_id, pet_name, pet_id, status, species, animal_id, event, last_date
+        tasks: pet_id, task_id, description, status
+    """
+    @abstractmethod
+    def read_users(self):
+        """ Returns:
+            list of user rows in creation order
+        """
+
+    @abstractmethod
+    def add_user(self, username, user_id, last_active=""):
+        """ Record a new account
+        Args:
+            username (str): unique username of the account holder
+            user_id (str): unique id of the account
+            last_active (str, optional): date of the account's last login. Defaults to unknown
+        """
+
+    @abstractmethod
+    def mark_active(self, user_ids, day):
+        """ Stamp accounts with the date of their last login
+        Args:
+            user_ids (iterable): ids of the accounts
+            day (str): the date to record
+        """
+
+    @abstractmethod
+    def lock_users(self):
+        """ Hold the users for a read-check-delete cycle: no account can be stamped active, added
+        or deleted by another process until the block ends
+        Returns:
+            context manager
+        """
+
+    @abstractmethod
+    def delete_accounts(self, user_ids):
+        """ Remove accounts with every pet, task and history row they own, in one pass over each
+        file (one transaction in SQLite)
+        Args:
+            user_ids (iterable): ids of the accounts to remove
+        """
+
+    @abstractmethod
+    def read_pets(self, user_id):
+        """ Args:
+            user_id (str): id of the pets' owner
+        Returns:
+            list of pet rows belonging to the user
+        """
+
+    @abstractmethod
+    def pet_ids(self):
+        """ Returns:
+            set of the ids of every pet
+        """
+
+    @abstractmethod
+    def add_pet(self, row):
+        """ Args:
+            row (list): pet row to be recorded
+        """
+
+    @abstractmethod
+    def write_pets(self, user_id, rows):
+        """ Replace every pet record of a user
+        Args:
+            user_id (str): id of the pets' owner
+            rows (list): the user's complete list of pet rows
+        """
+
+    @abstractmethod
+    def delete_pets(self, pet_ids):
+        """ Remove pets with every task and history row they own, in one pass over each file (one
+        transaction in SQLite)
+        Args:
+            pet_ids (iterable): ids of the pets to remove
+        """
+
+    @abstractmethod
+    def reset_pets(self, current):
+        """ Daily reset of every pet, in one pass: status 1 and event 0 for each pet last saved
+        before the current date, whose last_date becomes the current date
+        Args:
+            current (str): today's date
+        Returns:
+            number of pets reset
+        """
+
+    @abstractmethod
+    def read_tasks(self, pet_id):
+        """ Args:
+            pet_id (str): id of the pet the tasks belong to
+        Returns:
+            list of task rows belonging to the pet
+        """
+
+    @abstractmethod
+    def add_task(self, row):
+        """ Args:
+            row (list): task row to be recorded
+        """
+
+    @abstractmethod
+    def add_tasks(self, rows):
+        """ Record many tasks in a single write
+        Args:
+            rows (list): task rows to be recorded
+        """
+
+    @abstractmethod
+    def iter_tasks(self, pet_ids):
+        """ Stream the task rows of some pets without loading every task
+        Args:
+            pet_ids (list): ids of the pets whose tasks are wanted
+        Yields:
+            task rows, each pet's in creation order
+        """
+
+    @abstractmethod
+    def write_tasks(self, pet_id, rows):
+        """ Replace every task record of a pet
+        Args:
+            pet_id (str): id of the pet the tasks belong to
+            rows (list): the pet's complete list of task rows
+        """
+
+    @abstractmethod
+    def rollover_tasks(self, day):
+        """ Archive the completion of every pet's tasks as one history row per pet for the day,
+        then mark every task incomplete
+        Args:
+            day (str): the day the current statuses belong to
+        """
+
+    @abstractmethod
+    def read_history(self, pet_id):
+        """ Args:
+            pet_id (str): id of the pet
+        Returns:
+            list of [pet_id, day, task count, packed statuses] rows, oldest first
+        """
+
+    def next_id(self, kind):
+        """ Allocate an id from a persisted counter; ids are unique across every account and
+        never handed out twice, even after the record holding them is deleted
+        Args:
+            kind (str): "user", "pet" or "task"
+        Returns:
+            the new id as a str
+        """
+        return self.next_ids(kind, 1)[0]
+
+    @abstractmethod
+    def next_ids(self, kind, count):
+        """ Allocate consecutive ids with a single update of the counter
+        Args:
+            kind (str): "user", "pet" or "task"
+            count (int): number of ids wanted
+        Returns:
+            list of the new ids as str
+        """
+
+
+class GroupedCsv:
+    """ Index over a csv file whose rows are grouped by their first column (user_id for pets.csv,
+    pet_id for tasks.csv). The file is parsed once into a dict of key -> rows and lookups are served
+    from it; the index is dropped whenever the file changes on disk and writes update it in place.
+    Every write holds the file's lock from the freshness check to the rewrite, so a row another
+    process wrote in between is never overwritten
+    Attributes:
+        filename (str): the csv file being indexed
+        _groups (dict): rows grouped by their first column, None until loaded
+        _stamp (tuple): inode, modification time and size of the file when it was indexed
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self._groups = None
+        self._stamp = None
+
+    def _file_stamp(self):
+        stat = os.stat(self.filename) # a rewrite renames a new file in, so the inode changes too
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def groups(self):
+        """ Returns:
+            dict of key -> rows, re-read only when the file has changed since it was indexed
+        """
+        stamp = self._file_stamp()
+        if self._groups is None or stamp != self._stamp:
+            self._groups = {}
+            with open(self.filename, mode="r", newline="") as file:
+                for row in csv.reader(file):
+                    if row:
+                        self._groups.setdefault(row[0], []).append(row)
+            self._stamp = stamp
+        return self._groups
+
+    def get(self, key):
+        """ Args:
+            key (str): value of the first column
+        Returns:
+            list of rows with that key
+        """
+        return list(self.groups().get(key, []))
+
+    def append(self, row):
+        """ Append a single row to the file and the index
+        Args:
+            row (list): row to be written
+        """
+        row = [str(value) for value in row]
+        with lock_for(self.filename):
+            groups = self.groups()
+            append_row(self.filename, row)
+            groups.setdefault(row[0], []).append(row)
+            self._stamp = self._file_stamp()
+
+    def extend(self, rows):
+        """ Append rows to the file and the index with a single write
+        Args:
+            rows (list): rows to be written
+        """
+        rows = [[str(value) for value in row] for row in rows]
+        with lock_for(self.filename):
+            groups = self.groups()
+            append_rows(self.filename, rows)
+            for row in rows:
+                groups.setdefault(row[0], []).append(row)
+            self._stamp = self._file_stamp()
+
+    def replace(self, key, rows):
+        """ Replace every row with the given key
+        Args:
+            key (str): value of the first column
+            rows (list): the new rows for that key
+        """
+        rows = [[str(value) for value in row] for row in rows]
+        with lock_for(self.filename):
+            groups = self.groups()
+            if rows:
+                groups[key] = rows
+            else:
+                groups.pop(key, None)
+            self._flush()
+
+    def remove_values(self, column, values):
+        """ Remove every row holding one of the values in the given column, with at most one rewrite
+        Args:
+            column (int): index of the column to match
+            values (set): the values to remove
+        Returns:
+            the number of rows removed
+        """
+        with lock_for(self.filename):
+            groups = self.groups()
+            count = 0
+            for key in list(groups):
+                rows = [row for row in groups[key] if row[column] not in values]
+                count += len(groups[key]) - len(rows)
+                if rows:
+                    groups[key] = rows
+                else:
+                    del groups[key]
+            if count:
+                self._flush()
+        return count
+
+    def remove_keys(self, keys):
+        """ Remove every row whose first column is one of the keys, with at most one rewrite
+        Args:
+            keys (set): values of the first column to remove
+        Returns:
+            the removed rows
+        """
+        with lock_for(self.filename):
+            groups = self.groups()
+            removed = [row for key in keys for row in groups.pop(key, [])]
+            if removed:
+                self._flush()
+        return removed
+
+    def rewrite(self, transform):
+        """ Rewrite every row of the file in one pass
+        Args:
+            transform (callable): takes the list of all rows, returns the new rows and how many changed
+        Returns:
+            the number of rows changed; the file is left alone if none did
+        """
+        with lock_for(self.filename):
+            rows, count = transform([row for rows in self.groups().values() for row in rows])
+            if count:
+                self._groups = {}
+                for row in rows:
+                    self._groups.setdefault(row[0], []).append(row)
+                self._flush()
+        return count
+
+    def _flush(self):
+        """ Rewrite the file from the index
+        """
+        write_rows(self.filename, (row for rows in self._groups.values() for row in rows))
+        self._stamp = self._file_stamp()
+
+
+class CsvStorage(Storage):
+    """ Storage kept in users.csv, pets.csv, tasks.csv and history.csv; users.csv is an append-only
+    Journal, pets, tasks and history are served from a GroupedCsv index so each file is parsed
+    once, and every pet or task update rewrites the affected file
+    Attributes:
+        COLUMNS (dict): numbers of values of a complete row in each file, for startup recovery
+    """
+    COLUMNS = CSV_COLUMNS
+
+    def __init__(self):
+        for repair in recover_files(self.COLUMNS): # last run may have been killed mid-write
+            print(f"Recovery: {repair}")
+        for filename in (ACC_FILENAME, PETS_FILENAME, TASK_FILENAME, HISTORY_FILENAME):
+            if not os.path.exists(filename): # create new file if not found
+                open(filename, mode="w").close()
+        self._users = Journal(ACC_FILENAME, 1)
+        self._pets = GroupedCsv(PETS_FILENAME)
+        self._tasks = GroupedCsv(TASK_FILENAME)
+        self._history = GroupedCsv(HISTORY_FILENAME)
+
+    def _read_rows(self, filename):
+        """ Read every non-empty row of a csv file
+        Args:
+            filename (str): the csv file to read
+        Returns:
+            list of rows
+        """
+        with open(filename, mode="r", newline="") as file:
+            return [row for row in csv.reader(file) if row]
+
+    def _write_rows(self, filename, rows):
+        """ Atomically rewrite a csv file with the given rows
+        Args:
+            filename (str): the csv file to write
+            rows (list): rows to be written
+        """
+        write_rows(filename, rows)
+
+    def read_users(self):
+        # rows from before last_active have 2 values; malformed rows are skipped
+        return [row + [""] * (3 - len(row)) for row in self._users.rows() if len(row) in (2, 3)]
+
+    def add_user(self, username, user_id, last_active=""):
+        self._users.write([username, user_id, last_active])
+
+    def lock_users(self):
+        return lock_for(ACC_FILENAME)
+
+    def mark_active(self, user_ids, day):
+        with lock_for(ACC_FILENAME):
+            records = self._users.records()
+            self._users.write_many([records[user_id][:2] + [day] for user_id in set(user_ids) if user_id in records])
+
+    def delete_accounts(self, user_ids):
+        user_ids = set(user_ids)
+        with lock_for(PETS_FILENAME): # no pet may be added to these accounts meanwhile
+            pet_ids = {row[2] for user_id in user_ids for row in self._pets.get(user_id)}
+            self._tasks.remove_keys(pet_ids)
+            self._history.remove_keys(pet_ids)
+            self._pets.remove_keys(user_ids)
+        self._users.delete_many(user_ids)
+
+    def read_pets(self, user_id):
+        return self._pets.get(user_id)
+
+    def add_pet(self, row):
+        self._pets.append(row)
+
+    def write_pets(self, user_id, rows):
+        self._pets.replace(user_id, rows)
+
+    def delete_pets(self, pet_ids):
+        pet_ids = set(pet_ids)
+        with lock_for(PETS_FILENAME):
+            self._tasks.remove_keys(pet_ids)
+            self._history.remove_keys(pet_ids)
+            self._pets.remove_values(2, pet_ids)
+
+    def reset_pets(self, current):
+        return self._pets.rewrite(lambda rows: reset_rows(rows, current))
+
+    def read_tasks(self, pet_id):
+        return self._tasks.get(pet_id)
+
+    def pet_ids(self):
+        return {row[2] for rows in self._pets.groups().values() for row in rows}
+
+    def add_task(self, row):
+        self._tasks.append(row)
+
+    def add_tasks(self, rows):
+        self._tasks.extend(rows)
+
+    def iter_tasks(self, pet_ids):
+        pet_ids = set(pet_ids)
+        with open(TASK_FILENAME, mode="r", newline="") as file:
+            for row in csv.reader(file):
+                if row and row[0] in pet_ids:
+                    yield row
+
+    def write_tasks(self, pet_id, rows):
+        self._tasks.replace(pet_id, rows)
+
+    def rollover_tasks(self, day):
+        with lock_for(TASK_FILENAME): # no task may change between archiving and clearing
+            self._history.extend(archive_rows(self._tasks.groups(), day))
+            self._tasks.rewrite(clear_statuses)
+
+    def read_history(self, pet_id):
+        return self._history.get(pet_id)
+
+    def next_ids(self, kind, count):
+        with lock_for(IDS_FILENAME): # two processes must never read the same counter
+            counters = {}
+            if os.path.exists(IDS_FILENAME):
+                counters = {row[0]: int(row[1]) for row in self._read_rows(IDS_FILENAME)}
+            if kind not in counters: # first id of this kind; start after every id already in use
+                filename, column = ID_SOURCES[kind]
+                counters[kind] = max((int(row[column]) for row in self._read_rows(filename) if row[column].isdigit()),
+                                     default=FIRST_ID - 1)
+            first = counters[kind] + 1
+            counters[kind] += count
+            self._write_rows(IDS_FILENAME, counters.items())
+        return [str(new_id) for new_id in range(first, first + count)]
+
+
+class SqliteStorage(Storage):
+    """ Storage kept in a single SQLite database indexed on user_id and pet_id,
+    so an update only touches the rows of the affected user or pet
+    """
+    def __init__(self, filename=DB_FILENAME):
+        """ Open (or create) the database
+        Args:
+            filename (str, optional): path of the database file. Defaults to DB_FILENAME
+        """
+        self._conn = sqlite3.connect(filename)
+        self._held = False # inside lock_users; writes join its transaction
+        self._conn.executescript(SCHEMA)
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(users)")]
+        if "last_active" not in columns: # database created before the column existed
+            with self._conn:
+                self._conn.execute("ALTER TABLE users ADD COLUMN last_active TEXT NOT NULL DEFAULT ''")
+
+    def close(self):
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self, immediate=False):
+        """ Run a block of writes as one transaction, or as part of the one lock_users holds
+        Args:
+            immediate (bool, optional): take the write lock before the first read. Defaults to False
+        """
+        if self._held:
+            yield
+            return
+        with self._conn:
+            if immediate:
+                self._conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    @contextmanager
+    def lock_users(self):
+        if self._held:
+            yield
+            return
+        with self._transaction(immediate=True):
+            self._held = True
+            try:
+                yield
+            finally:
+                self._held = False
+
+    def read_users(self):
+        cursor = self._conn.execute("SELECT username, user_id, last_active FROM users ORDER BY rowid")
+        return [list(row) for row in cursor]
+
+    def add_user(self, username, user_id, last_active=""):
+        with self._transaction():
+            self._conn.execute("INSERT INTO users (username, user_id, last_active) VALUES (?, ?, ?)",
+                               (username, user_id, last_active))
+
+    def mark_active(self, user_ids, day):
+        with self._transaction():
+            self._conn.executemany("UPDATE users SET last_active = ? WHERE user_id = ?",
+                                   [(day, user_id) for user_id in set(user_ids)])
+
+    def delete_accounts(self, user_ids):
+        params = [(user_id,) for user_id in set(user_ids)]
+        with self._transaction():
+            for table in ("tasks", "history"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE pet_id IN "
+                                       "(SELECT pet_id FROM pets WHERE user_id = ?)", params)
+            self._conn.executemany("DELETE FROM pets WHERE user_id = ?", params)
+            self._conn.executemany("DELETE FROM users WHERE user_id = ?", params)
+
+    def read_pets(self, user_id):
+        cursor = self._conn.execute("SELECT user_id, name, pet_id, status, species, animal_id, event, last_date "
+                                    "FROM pets WHERE user_id = ? ORDER BY rowid", (user_id,))
+        return [list(row) for row in cursor]
+
+    def add_pet(self, row):
+        with self._transaction():
+            self._conn.execute("INSERT INTO pets VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+    def write_pets(self, user_id, rows):
+        with self._transaction():
+            self._conn.execute("DELETE FROM pets WHERE user_id = ?", (user_id,))
+            self._conn.executemany("INSERT INTO pets VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def delete_pets(self, pet_ids):
+        params = [(pet_id,) for pet_id in set(pet_ids)]
+        with self._transaction():
+            for table in ("tasks", "history", "pets"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE pet_id = ?", params)
+
+    def reset_pets(self, current):
+        with self._transaction():
+            cursor = self._conn.execute("UPDATE pets SET status = 1, event = 0, last_date = ? WHERE last_date != ?",
+                                        (current, current))
+        return cursor.rowcount
+
+    def read_tasks(self, pet_id):
+        cursor = self._conn.execute("SELECT pet_id, task_id, description, status "
+                                    "FROM tasks WHERE pet_id = ? ORDER BY rowid", (pet_id,))
+        return [list(row) for row in cursor]
+
+    def pet_ids(self):
+        return {row[0] for row in self._conn.execute("SELECT pet_id FROM pets")}
+
+    def add_task(self, row):
+        with self._transaction():
+            self._conn.execute("INSERT INTO tasks VALUES (?, ?, ?, ?)", row)
+
+    def add_tasks(self, rows):
+        with self._transaction():
+            self._conn.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?)", rows)
+
+    def iter_tasks(self, pet_ids):
+        for pet_id in pet_ids: # one indexed lookup per pet
+            cursor = self._conn.execute("SELECT pet_id, task_id, description, status FROM tasks "
+                                        "WHERE pet_id = ? ORDER BY rowid", (pet_id,))
+            for row in cursor:
+                yield list(row)
+
+    def write_tasks(self, pet_id, rows):
+        with self._transaction():
+            self._conn.execute("DELETE FROM tasks WHERE pet_id = ?", (pet_id,))
+            self._conn.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?)", rows)
+
+    def rollover_tasks(self, day):
+        with self._transaction(immediate=True): # no task may change between archiving and clearing
+            groups = {}
+            for row in self._conn.execute("SELECT pet_id, task_id, description, status FROM tasks ORDER BY rowid"):
+                groups.setdefault(row[0], []).append(row)
+            self._conn.executemany("INSERT INTO history VALUES (?, ?, ?, ?)", archive_rows(groups, day))
+            self._conn.execute("UPDATE tasks SET status = 0 WHERE status != 0")
+
+    def read_history(self, pet_id):
+        cursor = self._conn.execute("SELECT pet_id, day, count, bits FROM history WHERE pet_id = ? ORDER BY rowid",
+                                    (pet_id,))
+        return [list(row) for row in cursor]
+
+    def next_ids(self, kind, count):
+        with self._transaction(immediate=True): # take the write lock before reading the counter
+            row = self._conn.execute("SELECT last_id FROM ids WHERE kind = ?", (kind,)).fetchone()
+            if row is None: # first id of this kind; start after every id already in use
+                table, column = ID_COLUMNS[kind]
+                row = self._conn.execute(f"SELECT COALESCE(MAX(CAST({column} AS INTEGER)), ?) FROM {table}",
+                                         (FIRST_ID - 1,)).fetchone()
+            first = row[0] + 1
+            self._conn.execute("INSERT OR REPLACE INTO ids (kind, last_id) VALUES (?, ?)", (kind, row[0] + count))
+        return [str(new_id) for new_id in range(first, first + count)]
+
+
+def open_storage():
+    """ Pick the storage backend; the SQLite database is used once it has been migrated to
+    Returns:
+        the Storage instance for the app
+    """
+    if os.path.exists(DB_FILENAME):
+        return SqliteStorage()
+    return CsvStorage()
+
+
+def migrate_csv_to_sqlite(db_filename=DB_FILENAME):
+    """ One-shot copy of users.csv, pets.csv, tasks.csv and history.csv into a new SQLite database;
+    the csv files are left untouched as a backup
+    Args:
+        db_filename (str, optional): path of the database to create. Defaults to DB_FILENAME
+    Returns:
+        tuple of the number of users, pets and tasks migrated
+    """
+    if os.path.exists(db_filename):
+        raise FileExistsError(f"{db_filename} already exists; migration has been done before")
+
+    source = CsvStorage()
+    users = source.read_users()
+    pets = source._read_rows(PETS_FILENAME)
+    tasks = source._read_rows(TASK_FILENAME)
+    counters = source._read_rows(IDS_FILENAME) if os.path.exists(IDS_FILENAME) else []
+    history = source._read_rows(HISTORY_FILENAME)
+
+    target = SqliteStorage(db_filename)
+    with target._conn:
+        target._conn.executemany("INSERT INTO users (username, user_id, last_active) VALUES (?, ?, ?)", users)
+        target._conn.executemany("INSERT INTO pets VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (row[:3] + [int(value) for value in row[3:7]] + row[7:] for row in pets))
+        target._conn.executemany("INSERT INTO tasks VALUES (?, ?, ?, ?)",
+                                 (row[:3] + [int(row[3])] for row in tasks))
+        target._conn.executemany("INSERT INTO history VALUES (?, ?, ?, ?)",
+                                 (row[:2] + [int(row[2]), row[3]] for row in history))
+        target._conn.executemany("INSERT INTO ids (kind, last_id) VALUES (?, ?)",
+                                 ((kind, int(last_id)) for kind, last_id in counters))
+    target.close()
+    return len(users), len(pets), len(tasks)
+
+
+if __name__ == "__main__":
+    user_cnt, pet_cnt, task_cnt = migrate_csv_to_sqlite()
+    print(f"Migrated {user_cnt} users, {pet_cnt} pets and {task_cnt} tasks into {DB_FILENAME}")
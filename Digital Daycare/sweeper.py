@@ -0,0 +1,66 @@
+# Archive accounts idle for longer than a threshold, with their pets, tasks and history, into a cold file
+# usage: python sweeper.py [idle days]
+from atomic_write import append_rows
+from rules import today
+from datetime import date, timedelta
+import sys
+
+ARCHIVE_FILENAME = "archive.csv" # kind ("user", "pet", "task" or "history") followed by the record's row
+IDLE_DAYS = 90 # accounts not logged into for longer are archived
+
+
+def idle_users(users, cutoff):
+    """ Args:
+        users (list): user rows (username, user_id, last_active)
+        cutoff (str): accounts last active before this date are idle
+    Returns:
+        list of the idle accounts' ids; accounts without a last_active are never idle
+    """
+    return [user_id for username, user_id, last_active in users if last_active and last_active < cutoff]
+
+
+def cold_rows(storage, user_ids):
+    """ Args:
+        storage (Storage): the backend holding the accounts
+        user_ids (iterable): the accounts to archive
+    Yields:
+        archive rows of each account, then its pets, their tasks and history
+    """
+    users = {row[1]: row for row in storage.read_users()}
+    for user_id in user_ids:
+        yield ["user"] + users[user_id]
+        for pet in storage.read_pets(user_id):
+            yield ["pet"] + pet
+            yield from (["task"] + row for row in storage.read_tasks(pet[2]))
+            yield from (["history"] + row for row in storage.read_history(pet[2]))
+
+
+def sweep(storage, days=IDLE_DAYS, current=None):
+    """ Move idle accounts out of the hot files: they are appended to ARCHIVE_FILENAME first and
+    then deleted in one batch. Accounts with no last_active yet (created before it was recorded)
+    are stamped with the current date, so they become idle only after days more without a login.
+    The whole sweep holds the users (lock_users), so a login either lands before the idle check
+    reads its date or waits until the sweep is done; an account is never archived after a login
+    Args:
+        storage (Storage): the backend holding the accounts
+        days (int, optional): idle days before an account is archived. Defaults to IDLE_DAYS
+        current (str, optional): today's date. Defaults to rules.today()
+    Returns:
+        number of accounts archived
+    """
+    current = current or today()
+    with storage.lock_users():
+        users = storage.read_users()
+        storage.mark_active([user_id for username, user_id, last_active in users if not last_active], current)
+
+        user_ids = idle_users(users, str(date.fromisoformat(current) - timedelta(days=days)))
+        if user_ids:
+            append_rows(ARCHIVE_FILENAME, list(cold_rows(storage, user_ids)))
+            storage.delete_accounts(user_ids)
+    return len(user_ids)
+
+
+if __name__ == "__main__":
+    from storage import open_storage
+    count = sweep(open_storage(), int(sys.argv[1]) if len(sys.argv) > 1 else IDLE_DAYS)
+    print(f"Archived {count} idle accounts into {ARCHIVE_FILENAME}")
@@ -1,4 +1,6 @@
-class Task:
+from services import TaskRecord
+
+class Task(TaskRecord):
     """ Serves as a container called activities
         Attributes:
             root (Tk): root Tkinter window
@@ -8,7 +10,10 @@ class Task:
             _task_id (str): unique 5-digit id of Task instance
             _desc (str): task's text description
             _status (str): the task's completion status; 1 for completed, 0 otherwise
+            dirty (int): bits of the fields changed since the task was last saved
     """
+    __slots__ = ("root", "frame", "pet")
+
     def __init__(self, root, frame,pet, pet_id, task_id, description, status):
         """ Initializes a Task object
         Args:
@@ -20,31 +25,7 @@ class Task:
             description (str): the textual description of the task
             status (int): task status; 1 for completed, 0 for not completed
         """
+        super().__init__(pet_id, task_id, description, status)
         self.root = root
         self.frame = frame
         self.pet = pet
-        
-        self._pet_id = pet_id
-        self._desc = description
-        self._status = status
-        self._task_id = task_id
-    
-    @property
-    def task_id(self):
-        return self._task_id
-    
-    @property
-    def desc(self):
-        return self._desc
-    
-    @desc.setter
-    def desc(self, new_desc):
-        self._desc = new_desc
-    
-    @property
-    def status(self):
-        return self._status
-    
-    @status.setter
-    def status(self, new_status):        
-        self._status = new_status
@@ -1,9 +1,56 @@
 from account_manager import AccountManager
 import tkinter as tk
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from pet import Pet
+from storage import CsvStorage, SqliteStorage, Storage, migrate_csv_to_sqlite
+import storage as storage_module
+from persistence import PersistenceScheduler
+from assets import AssetCache
+from atlas import ATLAS_IMAGE, ATLAS_INDEX, load_atlas
+from PIL import Image
+from checklist import VirtualChecklist
+from services import STATUS_CHANGED, AccountRecord, DaycareService, TaskRecord
+from daily_reset import MARKER_FILENAME, last_reset, run_reset
+from bulk_tasks import read_pairs
+from sweeper import ARCHIVE_FILENAME, sweep
+import sweeper as sweeper_module
+from digital_daycare import App
+from name_index import NameIndex
+from task import Task
+import csv, io, multiprocessing, os, sqlite3, tempfile
+
+WRITERS = 4 # processes saving tasks at the same time
+ROUNDS = 25 # saves per process
+
+def save_tasks_repeatedly(directory, pet_id):
+    """ Stress test worker: add a task to one pet and save its tasks, ROUNDS times
+    Args:
+        directory (str): working directory shared by every worker
+        pet_id (str): the pet this worker owns
+    """
+    os.chdir(directory)
+    account = MagicMock()
+    account.service = DaycareService(CsvStorage())
+    pet = Pet(None, None, account, "Rex", pet_id, 1, 1, 1, 0)
+    pet.load_csv()
+    for i in range(ROUNDS):
+        pet._tasks.append(Task(None, None, pet, pet_id, f"{pet_id}{i:03}", f"task {i}", 0))
+        pet._tasks_changed = True
+        pet.save_tasks()
+
+def reset_at_startup(directory, barrier):
+    """ Worker: an app instance starting on 2024-01-02, all of them at the same moment
+    Args:
+        directory (str): working directory shared by every worker
+        barrier (Barrier): released once every worker is ready
+    """
+    os.chdir(directory)
+    storage = CsvStorage()
+    barrier.wait()
+    if last_reset() != "2024-01-02": # the startup check in digital_daycare.py
+        run_reset(storage, "2024-01-02")
 
 class TestApp(unittest.TestCase):
     def setUp(self):
@@ -19,7 +66,8 @@ class TestApp(unittest.TestCase):
         
         # Simulate the selection of an item (index 0 in this case)
         self.manager.listbox.curselection.return_value = (0,)
-        self.manager._users = [MagicMock(username="user1")] # Initialize test users
+        self.manager._add_user(MagicMock(username="user1", user_id="10001")) # Initialize test users
+        self.manager._shown = list(self.manager._users.values()) # the listbox shows every user
     
     def test_account_removal(self):
         # ensure we have 1 account
@@ -29,26 +77,544 @@ class TestApp(unittest.TestCase):
 
     def test_account_addition(self):
         # simulate adding a new user
-        new_user = MagicMock(username="user2")
-        self.manager._users.append(new_user)
+        new_user = MagicMock(username="user2", user_id="10002")
+        self.manager._add_user(new_user)
         
         self.assertEqual(len(self.manager._users), 2)
-        self.assertEqual(self.manager._users[1].username, "user2")  # Verify new user is added
+        self.assertEqual(self.manager.get_user("10002").username, "user2")  # Verify new user is added
 
     def test_account_selection(self):
         # simulate selection of the first user
         self.manager.listbox.curselection.return_value = (0,)
-        selected_user = self.manager._users[self.manager.listbox.curselection()[0]]
+        selected_user = self.manager._shown[self.manager.listbox.curselection()[0]]
         # ensure selected user is the one at index 0
         self.assertEqual(selected_user.username, "user1")
     
     def test_handle_removal_empty_list(self):
-        self.manager._users = []  # Ensure there are no users
+        self.manager._users = {}  # Ensure there are no users
         self.manager.listbox.curselection.return_value = ()  # simulate no selection
         
         self.manager.handle_removal()        
         self.assertEqual(len(self.manager._users), 0)
 
+
+class TestAccountIndex(unittest.TestCase):
+    def test_indexes_follow_users(self):
+        app = MagicMock()
+        app.service.users.side_effect = lambda factory: [factory("user1", "10001", ""),
+                                                         factory("user2", "10002", "2024-01-01")]
+        manager = AccountManager(None, None, app)
+        self.assertEqual(manager.find_user("user2").user_id, "10002")
+
+        removed = manager._remove_user("10001")
+        self.assertEqual(removed.username, "user1")
+        self.assertIsNone(manager.find_user("user1"))
+        self.assertIsNone(manager.get_user("10001"))
+        self.assertEqual(list(manager._users), ["10002"])
+        self.assertEqual(manager._index.matches(), ["user2"])
+
+
+class TestNameIndex(unittest.TestCase):
+    def test_prefix_search_and_paging(self):
+        index = NameIndex(["carol", "Bob", "bea", "alice"])
+        index.add("bobby")
+        self.assertEqual(index.matches("b"), ["bea", "Bob", "bobby"]) # case-insensitive, sorted
+        self.assertEqual(index.matches("BO", limit=1), ["Bob"])
+        self.assertEqual((index.count("b"), index.count("z"), len(index)), (3, 0, 5))
+        self.assertEqual(index.matches("", limit=2, start=2), ["Bob", "bobby"]) # second page of 2
+
+        index.remove("Bob")
+        index.remove("nobody") # unknown names are skipped
+        self.assertEqual(index.matches("bo"), ["bobby"])
+
+
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        # run inside a scratch directory so the real csv files are untouched
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def fill(self, storage):
+        storage.add_user("user1", "10001")
+        storage.add_user("user2", "10002")
+        storage.add_pet(["10001", "Rex", "20001", 1, 2, 4, 0, "2024-01-01"])
+        storage.add_pet(["10002", "Tom", "20002", 3, 1, 2, 1, "2024-01-01"])
+        storage.add_task(["20001", "30001", "Walk", 0])
+        storage.add_task(["20002", "30002", "Feed", 1])
+
+    def test_backends_match(self):
+        csv_storage = CsvStorage()
+        sql_storage = SqliteStorage(":memory:")
+        for storage in (csv_storage, sql_storage):
+            self.fill(storage)
+            storage.write_tasks("20001", [["20001", "30001", "Walk", 1]])
+            storage.delete_accounts(["10002"])
+
+        for storage in (csv_storage, sql_storage):
+            self.assertEqual([row[1] for row in storage.read_users()], ["10001"])
+            self.assertEqual(storage.read_pets("10002"), [])
+            self.assertEqual(int(storage.read_tasks("20001")[0][3]), 1)
+            self.assertEqual(storage.read_tasks("20002"), [])
+
+    def test_incomplete_backend_rejected(self):
+        class NoDeletes(CsvStorage):
+            delete_accounts = Storage.delete_accounts
+        with self.assertRaises(TypeError):
+            Storage()
+        with self.assertRaises(TypeError):
+            NoDeletes()
+
+    def test_user_journal(self):
+        storage = CsvStorage()
+        for i in range(20):
+            storage.add_user(f"user{i}", str(10000 + i))
+        for i in range(11):
+            storage.delete_accounts([str(10000 + i)])
+        with open("users.csv") as file: # deletes were only appended as tombstones
+            self.assertEqual(len(file.read().splitlines()), 31)
+        self.assertEqual([row[1] for row in CsvStorage().read_users()][:2], ["10011", "10012"])
+
+        storage.delete_accounts(["10011"]) # 24 of 32 rows are stale now; compact
+        with open("users.csv") as file:
+            self.assertEqual(len(file.read().splitlines()), 8)
+        self.assertEqual(len(CsvStorage().read_users()), 8)
+
+    def test_malformed_user_rows_skipped(self):
+        with open("users.csv", mode="w") as file:
+            file.write("user1,10001\n\nhand-edited\nuser2,10002,2024-01-01\nuser3,10003,2024-01-01,extra\n")
+        self.assertEqual(CsvStorage().read_users(), [["user1", "10001", ""], ["user2", "10002", "2024-01-01"]])
+
+    def test_recovery_after_interrupted_writes(self):
+        self.fill(CsvStorage())
+        with open("tasks.csv.tmp", mode="w") as file: # rewrite killed before its rename
+            file.write("20001,300")
+        with open("tasks.csv", mode="a", newline="") as file: # append killed mid-row
+            file.write("20002,3000")
+
+        storage = CsvStorage()
+        self.assertFalse(os.path.exists("tasks.csv.tmp"))
+        self.assertEqual([row[1] for row in storage.read_tasks("20002")], ["30002"])
+        storage.add_task(["20002", "30003", "Play", 0])
+        self.assertEqual(len(CsvStorage().read_tasks("20002")), 2)
+
+    def test_recovery_keeps_complete_unterminated_row(self):
+        storage = CsvStorage()
+        self.fill(storage)
+        with open("tasks.csv", mode="a", newline="") as file: # hand-edited, no final line end
+            file.write("20001,30003,Walk the dog,0")
+        with open("users.csv", mode="a", newline="") as file: # killed inside a tombstone
+            file.write("user1,10001,,del")
+
+        storage = CsvStorage()
+        self.assertEqual([row[1] for row in storage.read_tasks("20001")], ["30001", "30003"])
+        self.assertEqual([row[1] for row in storage.read_users()], ["10001", "10002"])
+        storage.add_task(["20001", "30004", "Feed", 0])
+        self.assertEqual(len(CsvStorage().read_tasks("20001")), 3)
+
+    def test_ids_unique_across_accounts(self):
+        csv_storage = CsvStorage()
+        sql_storage = SqliteStorage(":memory:")
+        for storage in (csv_storage, sql_storage):
+            self.fill(storage)
+            # counters start after the ids in use and never hand out a deleted id again
+            self.assertEqual(storage.next_id("pet"), "20003")
+            self.assertEqual(storage.next_id("task"), "30003")
+            self.assertEqual(storage.next_id("user"), "10003")
+            storage.delete_pets(["20002"]) # its task 30002 goes with it
+            self.assertEqual(storage.next_id("pet"), "20004")
+            self.assertEqual(storage.next_id("task"), "30004")
+
+    def test_grouped_index_sees_external_writes(self):
+        storage = CsvStorage()
+        self.fill(storage)
+        self.assertEqual(len(storage.read_tasks("20001")), 1)
+
+        # another writer appends a row behind the index's back
+        with open("tasks.csv", mode="a", newline="") as file:
+            file.write("20001,30003,Brush,0\n")
+        self.assertEqual([row[1] for row in storage.read_tasks("20001")], ["30001", "30003"])
+
+    def test_migration(self):
+        source = CsvStorage()
+        self.fill(source)
+        source.next_id("task")
+        self.assertEqual(migrate_csv_to_sqlite(), (2, 2, 2))
+        storage = SqliteStorage()
+        self.assertEqual(storage.read_pets("10002")[0][:3], ["10002", "Tom", "20002"])
+        self.assertEqual(storage.read_tasks("20001"), [["20001", "30001", "Walk", 0]])
+        self.assertEqual(storage.next_id("task"), "30004") # 30003 was handed out before migrating
+        storage.close()
+        self.assertRaises(FileExistsError, migrate_csv_to_sqlite)
+
+    def test_daily_reset(self):
+        csv_storage = CsvStorage()
+        sql_storage = SqliteStorage(":memory:")
+        for storage in (csv_storage, sql_storage):
+            self.fill(storage) # both pets last saved on 2024-01-01
+            if os.path.exists(MARKER_FILENAME): # the marker is per directory, not per backend
+                os.remove(MARKER_FILENAME)
+            self.assertEqual(run_reset(storage, "2024-01-02"), 2)
+            self.assertEqual(run_reset(storage, "2024-01-02"), 0)
+            rows = storage.read_pets("10002")
+            self.assertEqual([int(rows[0][3]), int(rows[0][6]), rows[0][7]], [1, 0, "2024-01-02"])
+        self.assertEqual(last_reset(), "2024-01-02")
+
+        # once the day's reset ran, loading skips the date check
+        with open("pets.csv", mode="a", newline="") as file:
+            file.write("10001,Max,20003,4,1,1,1,2023-12-31\r\n")
+        pets = DaycareService(csv_storage).load_pets("10001", current="2024-01-02")
+        self.assertEqual([pet.status for pet in pets], [1, 4])
+
+    def test_reset_when_session_passes_midnight(self):
+        storage = CsvStorage()
+        self.fill(storage)
+        app = MagicMock(day="2024-01-01", storage=storage)
+        with patch("digital_daycare.today", return_value="2024-01-01"):
+            App.check_day(app)
+        self.assertIsNone(last_reset())
+        app.scheduler.flush.assert_not_called()
+
+        with patch("digital_daycare.today", return_value="2024-01-02"):
+            App.check_day(app)
+        self.assertEqual((app.day, last_reset()), ("2024-01-02", "2024-01-02"))
+        self.assertEqual(storage.read_pets("10002")[0][3], "1")
+        app.scheduler.flush.assert_called_once()
+        app._manager.start_new_day.assert_called_once()
+        self.assertEqual(app.root.after.call_count, 2) # keeps checking
+
+    def test_reset_runs_once_across_instances(self):
+        storage = CsvStorage()
+        self.fill(storage)
+        storage.add_task(["20002", "30003", "Play", 0])
+        barrier = multiprocessing.Barrier(WRITERS)
+        workers = [multiprocessing.Process(target=reset_at_startup, args=(self.tmp.name, barrier))
+                   for _ in range(WRITERS)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+
+        self.assertEqual(DaycareService(CsvStorage()).completion_history("20002"), {"2024-01-01": [1, 0]})
+        self.assertEqual(run_reset(CsvStorage(), "2024-01-02"), 0)
+
+    def test_task_rollover_history(self):
+        csv_storage = CsvStorage()
+        sql_storage = SqliteStorage(":memory:")
+        for storage in (csv_storage, sql_storage):
+            self.fill(storage)
+            storage.add_task(["20002", "30003", "Play", 0])
+            storage.add_task(["20002", "30004", "Nap", 1])
+            storage.rollover_tasks("2024-01-01")
+            storage.write_tasks("20002", [["20002", "30002", "Feed", 1]] + storage.read_tasks("20002")[1:])
+            storage.rollover_tasks("2024-01-02")
+
+            service = DaycareService(storage)
+            self.assertEqual(service.completion_history("20002"),
+                             {"2024-01-01": [1, 0, 1], "2024-01-02": [1, 0, 0]})
+            self.assertEqual([int(row[3]) for row in storage.read_tasks("20002")], [0, 0, 0])
+            self.assertEqual(storage.read_history("20002")[0][3], "5") # 0b101
+
+    def test_account_cascade_one_pass_per_file(self):
+        csv_storage = CsvStorage()
+        sql_storage = SqliteStorage(":memory:")
+        for storage in (csv_storage, sql_storage):
+            self.fill(storage)
+            for pet_id in ("20003", "20004"):
+                storage.add_pet(["10001", "Pet", pet_id, 1, 1, 1, 0, "2024-01-01"])
+                storage.add_task([pet_id, "3" + pet_id[1:], "Walk", 1])
+            storage.rollover_tasks("2024-01-01")
+
+            with patch("storage.write_rows", wraps=storage_module.write_rows) as rewrite:
+                storage.delete_accounts(["10001"])
+            if storage is csv_storage: # tasks, history and pets once each; users.csv is appended to
+                self.assertEqual(sorted(call.args[0] for call in rewrite.call_args_list),
+                                 ["history.csv", "pets.csv", "tasks.csv"])
+
+            self.assertEqual([row[1] for row in storage.read_users()], ["10002"])
+            self.assertEqual(storage.pet_ids(), {"20002"})
+            for pet_id in ("20001", "20003", "20004"):
+                self.assertEqual((storage.read_tasks(pet_id), storage.read_history(pet_id)), ([], []))
+            self.assertEqual(len(storage.read_history("20002")), 1)
+
+    def test_batch_pet_deletion(self):
+        for storage in (CsvStorage(), SqliteStorage(":memory:")):
+            self.fill(storage)
+            storage.add_pet(["10001", "Rex", "20003", 1, 2, 4, 0, "2024-01-01"])
+            storage.rollover_tasks("2024-01-01")
+            storage.delete_pets(["20001", "20002", "29999"]) # unknown ids are skipped
+            self.assertEqual(storage.pet_ids(), {"20003"})
+            for pet_id in ("20001", "20002"):
+                self.assertEqual((storage.read_tasks(pet_id), storage.read_history(pet_id)), ([], []))
+
+    def test_batch_user_deletion_appends_once(self):
+        storage = CsvStorage()
+        for i in range(5):
+            storage.add_user(f"user{i}", str(10000 + i))
+        with patch("journal.append_rows", wraps=storage_module.append_rows) as append:
+            storage.delete_accounts(["10001", "10002", "10003"])
+        self.assertEqual(append.call_count, 1) # three tombstones, one write
+        self.assertEqual([row[1] for row in storage.read_users()], ["10000", "10004"])
+
+    def test_sweep_archives_idle_accounts(self):
+        for storage in (CsvStorage(), SqliteStorage(":memory:")):
+            self.fill(storage)
+            storage.add_user("user3", "10003", "2024-01-01")
+            service = DaycareService(storage)
+            service.touch_user("10002", "", current="2024-03-01")
+            storage.rollover_tasks("2024-01-01")
+
+            # user1 has no last_active yet: stamped by the first sweep, not archived
+            self.assertEqual(sweep(storage, days=30, current="2024-03-15"), 1)
+            self.assertEqual([row[1:] for row in storage.read_users()],
+                             [["10001", "2024-03-15"], ["10002", "2024-03-01"]])
+            self.assertEqual(sweep(storage, days=30, current="2024-04-10"), 1) # user2 now idle
+            self.assertEqual(storage.pet_ids(), {"20001"})
+
+        with open(ARCHIVE_FILENAME, newline="") as file: # both backends archive into the same file
+            kinds = [row[0] for row in csv.reader(file)]
+        self.assertEqual(kinds, ["user", "user", "pet", "task", "history"] * 2)
+
+    @unittest.skipIf(os.name == "nt", "flock probe")
+    def test_sweep_holds_users_until_deleted(self):
+        import fcntl # only reached off Windows
+        def users_locked(storage):
+            if isinstance(storage, SqliteStorage): # another connection cannot write meanwhile
+                other = sqlite3.connect("daycare.db", timeout=0)
+                try:
+                    other.execute("UPDATE users SET last_active = '2024-04-01'")
+                    return False
+                except sqlite3.OperationalError:
+                    return True
+                finally:
+                    other.close()
+            with open("users.csv.lock", mode="a+b") as file: # flock conflicts across open files
+                try:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return False
+                except BlockingIOError:
+                    return True
+
+        for storage in (CsvStorage(), SqliteStorage("daycare.db")):
+            storage.add_user("user1", "10001", "2024-01-01")
+            seen = []
+            def archive(filename, rows):
+                seen.append(users_locked(storage)) # a login would land between check and delete
+                storage_module.append_rows(filename, rows)
+            with patch.object(sweeper_module, "append_rows", archive):
+                self.assertEqual(sweep(storage, days=30, current="2024-03-15"), 1)
+            self.assertEqual(seen, [True])
+            self.assertFalse(users_locked(storage))
+            self.assertEqual(storage.read_users(), [])
+        storage.close()
+
+    def test_concurrent_saves_lose_no_rows(self):
+        CsvStorage() # create the files before the writers start
+        pet_ids = [str(20001 + i) for i in range(WRITERS)]
+        workers = [multiprocessing.Process(target=save_tasks_repeatedly, args=(self.tmp.name, pet_id))
+                   for pet_id in pet_ids]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+
+        storage = CsvStorage()
+        for pet_id in pet_ids:
+            self.assertEqual(len(storage.read_tasks(pet_id)), ROUNDS)
+
+
+class TestDaycareService(unittest.TestCase):
+    def test_headless_pet_and_tasks(self):
+        service = DaycareService(SqliteStorage(":memory:"))
+        user_id = service.create_user("user1")
+        pet = service.create_pet(user_id, "Rex", 5)
+        self.assertEqual(pet.species, 2)
+        for description in ("Walk", "Feed", "Play"):
+            service.create_task(pet, description)
+        pet.toggle_tasks(pet.tasks[:2])
+        self.assertTrue(service.save_tasks(pet))
+        self.assertFalse(service.save_tasks(pet)) # nothing changed since
+
+        self.assertEqual(pet.task_mood(), 4) # ceil(2/3 * 5)
+        pet.status = pet.task_mood()
+        service.save_pets(user_id, [pet])
+        loaded = service.load_pets(user_id, current="2000-01-01")[0] # saved on another day: reset
+        self.assertEqual((loaded.status, loaded.event, loaded.dirty), (1, 0, {"status", "last_date"}))
+        self.assertEqual([task.status for task in service.load_tasks(pet.pet_id)], [1, 1, 0])
+
+        service.delete_user(user_id)
+        self.assertEqual((service.users(), service.load_tasks(pet.pet_id)), ([], []))
+
+    def test_task_counts_follow_changes(self):
+        service = DaycareService(SqliteStorage(":memory:"))
+        pet = service.create_pet(service.create_user("user1"), "Rex", 1)
+        for description in ("Walk", "Feed", "Play", "Nap"):
+            service.create_task(pet, description)
+        pet.toggle_tasks(pet.tasks[:3])
+        pet.toggle_tasks(pet.tasks[2:])
+        self.assertEqual((pet.counts.total, pet.counts.completed), (4, 3))
+        pet.remove_tasks(pet.tasks[:1])
+        self.assertEqual((pet.counts.total, pet.counts.completed), (3, 2))
+        self.assertEqual(pet.task_mood(), 4) # ceil(2/3 * 5)
+
+        pet.set_tasks(service.load_tasks(pet.pet_id)) # removal not saved yet; reload recounts
+        self.assertEqual((pet.counts.total, pet.counts.completed), (4, 0))
+
+
+class TestRecords(unittest.TestCase):
+    def test_compact_records_and_table(self):
+        task = TaskRecord("20001", "30001", "Walk", 0)
+        self.assertFalse(hasattr(task, "__dict__"))
+        task.status = 1
+        self.assertEqual(task.dirty, STATUS_CHANGED)
+
+        storage = SqliteStorage(":memory:")
+        storage.add_pet(["10001", "Rex", "20001", 3, 2, 4, 0, "2024-01-01"])
+        storage.add_pet(["10001", "Tom", "20002", 1, 1, 1, 0, "2024-01-01"])
+        storage.add_tasks([["20001", "30001", "Walk", 1], ["20002", "30002", "Feed", 0],
+                           ["20001", "30003", "Nap", 1]])
+        storage.add_user("user1", "10001", "2024-01-01")
+        account = DaycareService(storage).users()[0]
+        self.assertIsInstance(account, AccountRecord)
+        self.assertFalse(hasattr(account, "__dict__"))
+        self.assertEqual((account.username, account.user_id, account.last_active), ("user1", "10001", "2024-01-01"))
+
+        table = DaycareService(storage).task_table()
+        self.assertEqual((len(table), table.completed()), (3, 2))
+        self.assertEqual(table.counts_by_pet(), {"20001": (2, 2), "20002": (0, 1)})
+        self.assertEqual(table.row(1), ["20001", "30003", "Nap", 1])
+        self.assertEqual(table.clear_statuses(), 2)
+        self.assertEqual([row[3] for row in table.rows()], [0, 0, 0])
+
+
+class TestBulkTasks(unittest.TestCase):
+    def setUp(self):
+        self.service = DaycareService(SqliteStorage(":memory:"))
+        user_id = self.service.create_user("user1")
+        self.pets = [self.service.create_pet(user_id, name, 1).pet_id for name in ("Rex", "Tom")]
+        self.user_id = user_id
+
+    def test_import_and_export(self):
+        text = f"pet,description\n{self.pets[0]},Walk\n{self.pets[1]}, Feed \n{self.pets[0]},Play\n"
+        rows = self.service.import_tasks(read_pairs(io.StringIO(text), "csv"))
+        self.assertEqual([row[2] for row in rows], ["Walk", "Feed", "Play"])
+        self.assertEqual([int(row[1]) for row in rows], [10000, 10001, 10002]) # one batch of ids
+
+        lines = "\n".join(f'{{"pet": "{self.pets[1]}", "description": "Nap"}}' for _ in range(2))
+        self.service.import_tasks(read_pairs(io.StringIO(lines), "json"))
+        exported = self.service.export_tasks(user_id=self.user_id)
+        self.assertNotIsInstance(exported, list)
+        self.assertEqual([row[2] for row in exported], ["Walk", "Play", "Feed", "Nap", "Nap"])
+
+    def test_invalid_import_saves_nothing(self):
+        pairs = [(self.pets[0], "Walk"), ("99999", "Feed"), (self.pets[1], "  ")]
+        with self.assertRaises(ValueError) as context:
+            self.service.import_tasks(pairs)
+        self.assertIn("2: unknown pet", str(context.exception))
+        self.assertIn("3: empty description", str(context.exception))
+        self.assertEqual(list(self.service.export_tasks(pet_id=self.pets[0])), [])
+
+    def test_json_items_must_be_objects(self):
+        text = f'[{{"pet": "{self.pets[0]}", "description": "Walk"}}, 1, "x"]'
+        with self.assertRaises(ValueError) as context:
+            self.service.import_tasks(read_pairs(io.StringIO(text), "json"))
+        self.assertIn("2: not a JSON object: 1", str(context.exception))
+        self.assertEqual(list(self.service.export_tasks(pet_id=self.pets[0])), [])
+
+
+class TestPersistenceScheduler(unittest.TestCase):
+    def test_flush_coalesces_saves(self):
+        scheduler = PersistenceScheduler()
+        account, pet = MagicMock(), MagicMock()
+
+        # several mutations of the same pet only queue one save each
+        for _ in range(3):
+            scheduler.save_pets_later(account)
+            scheduler.save_tasks_later(pet)
+        scheduler.flush()
+        scheduler.flush() # nothing pending anymore
+
+        account.save_pets.assert_called_once()
+        pet.save_tasks.assert_called_once()
+        self.assertEqual(scheduler.flush_count, 1)
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_images_decoded_once(self):
+        assets = AssetCache()
+        first = assets.photo("interfaces/return_button.png", (33, 33))
+        second = assets.photo("interfaces/return_button.png", (33, 33))
+        assets.photo("interfaces/return_button.png", (36, 36)) # other size is its own entry
+
+        self.assertIs(first, second)
+        self.assertEqual((assets.hits, assets.misses), (1, 2))
+
+
+class TestAtlas(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.mkdir("pets")
+        os.mkdir("interfaces")
+        Image.new("RGBA", (4, 6), "red").save("pets/dog1.png")
+        Image.new("RGBA", (5, 3), "blue").save("interfaces/status1.png")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_corrupt_atlas_is_rebuilt_or_skipped(self):
+        self.assertEqual(load_atlas()["dog1"].size, (4, 6))
+        with open(ATLAS_INDEX, mode="w") as file:
+            file.write('{"dog1": [0, 0,') # cut short mid-write
+        self.assertEqual(load_atlas()["status1"].size, (5, 3)) # unreadable index means stale
+        self.assertEqual(sorted(os.listdir("pets")), ["atlas.json", "atlas.json.lock", "atlas.png", "dog1.png"])
+
+        with open(ATLAS_IMAGE, mode="wb") as file:
+            file.write(b"\x89PNG") # corrupt sheet; the loose files are used instead
+        sprites = load_atlas()
+        self.assertEqual(sprites["dog1"].size, (4, 6))
+        self.assertEqual(sprites["dog1"].filename, "pets/dog1.png")
+
+
+class TestVirtualChecklist(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_rows_only_for_visible_tasks(self):
+        canvas = tk.Canvas(self.root, width=320, height=240)
+        assets = AssetCache()
+        checklist = VirtualChecklist(canvas, tk.Scrollbar(self.root), assets)
+        tasks = [MagicMock(desc=f"task {i}", status=i % 2) for i in range(500)]
+        checklist.set_tasks(tasks)
+        self.assertLess(len(checklist._rows), 20)
+        self.assertIs(checklist._rows[0][0].icons, checklist._rows[1][0].icons) # shared by every row
+        self.assertEqual(assets.misses, 4) # each icon decoded once, by the app's cache
+
+        row = checklist._rows[1][0]
+        row.toggle()
+        canvas.yview_moveto(0.5) # scrolling recycles the rows but keeps the states
+        self.assertEqual(checklist.selected(), [tasks[1]])
+        self.assertLess(len(checklist._rows), 20)
+
             
 if __name__ == "__main__":
     unittest.main()
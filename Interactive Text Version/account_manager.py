@@ -1,69 +1,110 @@
 from check_input import *
 from account import Account
-import csv, random
+from name_index import NameIndex
+from rules import today
 
-ACC_FILENAME = "users.csv"
+PAGE_SIZE = 10 # accounts listed at once
+NEXT_PAGE, PREVIOUS_PAGE = ">", "<"
+SEARCH = "/" # starts a search, for usernames beginning with a digit
 
 class AccountManager:
     """ Handles actions involving accounts
     Attributes:
-        _users(Account[]): stores a list of Account objects
+        service(DaycareService): creates, loads and deletes account records
+        _users(dict): user_id -> Account, in creation order
+        _by_name(dict): username -> Account, kept in sync with _users
+        _index(NameIndex): usernames in sorted order for paging and prefix search, kept in sync with _users
     """
-    def __init__(self):
+    def __init__(self, service):
         """ Loads in recorded accounts
         Args:
             self (AccountManager): the AccountManager instance to be initialized
+            service (DaycareService): creates, loads and deletes account records
         Returns:
             None
         """
-        self._users = []
-        try:            
-            with open(ACC_FILENAME, mode="r") as file:
-                reader = csv.reader(file)            
-                for row in reader:
-                    if len(row) == 2:
-                    username, user_id = row
-                    self._users.append(Account(username, user_id))
-        except FileNotFoundError: # create new file if users.csv not found
-            print("Error: users.csv file not found. Creating a new file.")
-            open(ACC_FILENAME, mode="w").close()            
+        self.service = service
+        self._users = {}
+        self._by_name = {}
+        self._index = NameIndex()
+        for account in self.service.users(self.make_account): # malformed rows are skipped
+            self._add_user(account)
     
-    def display_accounts(self):
-        """ Display current accounts
+    def make_account(self, username, user_id, last_active=""):
+        """ Account factory for the service
         Args:
-            self (AccountManager): the AccountManager instance to be accessed
+            username (str): unique username of the account holder
+            user_id (str): unique id of the account
+            last_active (str, optional): date of the last login. Defaults to unknown
+        Returns:
+            the Account instance
+        """
+        return Account(self.service, username, user_id, last_active)
+
+    def _add_user(self, account):
+        """ Record an account in both indexes
+        Args:
+            account (Account): the Account instance to add
         Returns:
             None
         """
-        print("\nAccounts:")
-        if len(self._users) != 0:
-            for index,acc in enumerate(self._users, start=1):
-                print(f"{index}. {acc.username}")
+        self._users[account.user_id] = account
+        self._by_name[account.username] = account
+        self._index.add(account.username)
+    
+    def display_accounts(self, prefix="", page=0):
+        """ Display one page of the accounts, in alphabetical order
+        Args:
+            self (AccountManager): the AccountManager instance to be accessed
+            prefix (str, optional): only list usernames starting with it. Defaults to every account
+            page (int, optional): the page to display, from 0. Defaults to the first
+        Returns:
+            list of the usernames displayed, in the numbered order
+        """
+        total = self._index.count(prefix)
+        names = self._index.matches(prefix, PAGE_SIZE, page * PAGE_SIZE)
+        print(f'\nAccounts starting with "{prefix}":' if prefix else "\nAccounts:")
+        if names:
+            for index, name in enumerate(names, start=1):
+                print(f"{index}. {name}")
+            print(f"(page {page + 1} of {(total + PAGE_SIZE - 1) // PAGE_SIZE}, {total} accounts)")
         else:
-            print("No existing users.")
+            print("No matching users." if prefix else "No existing users.")
+        return names
         
     def choose_account(self):        
-        """ Display available username and process chosen account                        
+        """ Display a page of usernames at a time and process chosen account; typing the start of a
+        username narrows the list down. A number of the shown list always selects that entry; any
+        other input searches, and SEARCH in front searches for names that begin with digits
         Args:
             self (AccountManager): the AccountManager instance to be accessed
         Returns:
-            the Account object chosen by the user
+            the Account object chosen by the user, None to return to login
         """
-        # its length is additionally used as index for Exit option
-        curr_users = len(self._users) 
-        if curr_users==0: # if no users, create new account
+        if len(self._users) == 0: # if no users, create new account
             print("There are no existing accounts. Let's make a new one!\n")
             return self.create_account()
-        else:    
-            self.display_accounts()            
-            print(f"{curr_users+ 1}. Return to Login")
-            print("Which account is yours? ", end="")
-            
-            choice = get_int_range("",1, curr_users+1)
-            if choice != curr_users+1:
-                return self._users[choice-1]
-            else:
-                return None
+
+        prefix, page = "", 0
+        while True:
+            names = self.display_accounts(prefix, page)
+            # the option after the listed accounts returns to login
+            print(f"{len(names) + 1}. Return to Login")
+            choice = input(f"Which account is yours? (its number above, {PREVIOUS_PAGE}/{NEXT_PAGE} for the previous/next page, "
+                           f"or the start of your username, after {SEARCH} if it starts with a digit; "
+                           "empty to list all) ").strip()
+
+            if choice.isdigit() and 1 <= int(choice) <= len(names) + 1: # the list number wins over a search
+                if int(choice) == len(names) + 1:
+                    return None
+                return self._by_name[names[int(choice) - 1]]
+            elif choice == NEXT_PAGE:
+                if (page + 1) * PAGE_SIZE < self._index.count(prefix):
+                    page += 1
+            elif choice == PREVIOUS_PAGE:
+                page = max(page - 1, 0)
+            else: # search by username; empty clears it
+                prefix, page = choice.removeprefix(SEARCH), 0
     
     def create_account(self):
         """ Create a new account for the user
@@ -73,23 +114,14 @@ class AccountManager:
             the newly created Account object 
         """
         # choose and validate username
-        username = get_username("Please choose a username: ",[account.username for account in self._users])
+        username = get_username("Please choose a username: ", self._by_name)
 
-        # Generate a random 5-digit ID
-        curr_ids = [account.user_id for account in self._users]
-        while True:
-            new_id = str(random.randint(10000, 99999))
-            if new_id not in curr_ids:
-                break
+        # saving new account
+        new_id = self.service.create_user(username)
         
         # Create and store Account instance
-        new_account = Account(username, new_id)
-        self._users.append(new_account)
-        
-        # saving new account to csv
-        with open(ACC_FILENAME, mode="a", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow([username, new_id])        
+        new_account = self.make_account(username, new_id, today())
+        self._add_user(new_account)
                 
         print(f"Account created!")
         return new_account
@@ -98,20 +130,12 @@ class AccountManager:
         users_cnt = len(self._users)
                 
         if users_cnt != 0:                                               
-            # re-read csv to filter
-            new_rows = []
-            with open(ACC_FILENAME, mode="r", newline="") as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if row and row[1] != account.user_id:
-                        new_rows.append(row)
-            
-            # rewrite
-            with open(ACC_FILENAME, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerows(new_rows)            
+            # pets and activities go with the account
+            self.service.delete_user(account.user_id)
                                      
-            self._users.remove(account)
+            del self._users[account.user_id]
+            del self._by_name[account.username]
+            self._index.remove(account.username)
             print(f"Removal completed.")
         else:
             print("There's no accounts to delete.")
@@ -126,7 +150,8 @@ class AccountManager:
         have_account = get_yes_no("1. Do you have an account already? (y/n) ")
         if have_account:            
             user = self.choose_account()
-            if user != -1:
+            if user is not None:
+                user.last_active = self.service.touch_user(user.user_id, user.last_active)
                 print()
                 print("~" * 7 + f" Welcome {user.username}! " + "~" * 7)
                 return user
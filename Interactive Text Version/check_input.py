@@ -96,7 +96,7 @@ def get_username(prompt, curr_usernames):
     Args:
         prompt(str): display prompt before taking input
         new_user (str): the chosen username
-        curr_usernames (str[]): the list of existing usernames
+        curr_usernames (str[] or dict): the existing usernames; a dict or set checks in O(1)
     Returns:
         a unique username
     """
@@ -0,0 +1,51 @@
+from daily_reset import reset_rows
+from storage import CSV_COLUMNS, PETS_FILENAME, CsvStorage
+
+# position in an app pets row (user_id, pet_name, pet_id, status, species, animal_id, event, last_date)
+# of each column of the text version's pets.csv (user_id, pet_name, pet_id, status, species, challenge, last_date)
+PET_COLUMNS = (0, 1, 2, 3, 4, 6, 7)
+SPECIES, ANIMAL_ID = 4, 5 # the text version has no animals; the species stands in for one
+
+
+def to_app_row(row):
+    """ Args:
+        row (list): a pets.csv row of the text version
+    Returns:
+        the pet as an app pets row
+    """
+    app_row = [None] * (len(PET_COLUMNS) + 1)
+    for column, value in zip(PET_COLUMNS, row):
+        app_row[column] = value
+    app_row[ANIMAL_ID] = app_row[SPECIES]
+    return app_row
+
+
+def to_cli_row(row):
+    """ Args:
+        row (list): an app pets row
+    Returns:
+        the pet as a pets.csv row of the text version
+    """
+    return [row[column] for column in PET_COLUMNS]
+
+
+class CliStorage(CsvStorage):
+    """ CsvStorage over the text version's files; its pets.csv keeps the daily challenge where the
+    app keeps animal_id and event, so pet rows are mapped through PET_COLUMNS on the way in and out
+    """
+    COLUMNS = {**CSV_COLUMNS, PETS_FILENAME: (len(PET_COLUMNS),)}
+
+    def read_pets(self, user_id):
+        return [to_app_row(row) for row in super().read_pets(user_id)]
+
+    def add_pet(self, row):
+        super().add_pet(to_cli_row(row))
+
+    def write_pets(self, user_id, rows):
+        super().write_pets(user_id, [to_cli_row(row) for row in rows])
+
+    def reset_pets(self, current):
+        def reset(rows):
+            rows, count = reset_rows([to_app_row(row) for row in rows], current)
+            return [to_cli_row(row) for row in rows], count
+        return self._pets.rewrite(reset)
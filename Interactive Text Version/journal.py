@@ -0,0 +1,138 @@
+from atomic_write import append_rows, write_rows
+from file_lock import lock_for
+import csv, os
+
+TOMBSTONE = "deleted" # last value of a row that deletes its key
+COMPACT_RATIO = 0.5 # compact once this share of the rows is stale
+COMPACT_MIN_ROWS = 32 # smaller files are not worth rewriting
+
+
+class Journal:
+    """ Append-only csv log of records keyed by one column. Writing a record appends it (the last
+    row of a key wins) and deleting one appends a tombstone, so no update rewrites the file.
+    Replaying the log gives the live records; once stale rows (tombstones and the rows they
+    shadow) make up COMPACT_RATIO of the file it is rewritten to the live rows through a
+    temp file and an atomic rename. Every change holds the file's lock, and the log is replayed
+    inside it if another process changed it, so concurrent writers never lose a record
+    Attributes:
+        filename (str): the csv file holding the log
+        key_column (int): the column identifying a record
+        _records (dict): key -> live row, in creation order; None until loaded
+        _rows (int): number of rows in the file
+        _stamp (tuple): inode, modification time and size of the file when it was replayed
+    """
+    def __init__(self, filename, key_column):
+        """ Args:
+            filename (str): the csv file holding the log
+            key_column (int): the column identifying a record
+        """
+        self.filename = filename
+        self.key_column = key_column
+        self._records = None
+        self._rows = 0
+        self._stamp = None
+
+    def _file_stamp(self):
+        stat = os.stat(self.filename)
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def records(self):
+        """ Returns:
+            dict of key -> live row, replayed again only when the file changed since
+        """
+        stamp = self._file_stamp()
+        if self._records is None or stamp != self._stamp:
+            self._records = {}
+            self._rows = 0
+            with open(self.filename, mode="r", newline="") as file:
+                for row in csv.reader(file):
+                    if len(row) <= self.key_column: # blank or hand-edited line without a key
+                        continue
+                    self._rows += 1
+                    if row[-1] == TOMBSTONE:
+                        self._records.pop(row[self.key_column], None)
+                    else:
+                        self._records[row[self.key_column]] = row
+            self._stamp = stamp
+        return self._records
+
+    def rows(self):
+        """ Returns:
+            list of the live rows in creation order
+        """
+        return list(self.records().values())
+
+    def _append(self, rows):
+        """ Append rows to the log in one write
+        Args:
+            rows (list): rows to be written
+        """
+        append_rows(self.filename, rows)
+        self._rows += len(rows)
+        self._stamp = self._file_stamp()
+
+    def write(self, row):
+        """ Add or update a record
+        Args:
+            row (list): the record's complete row
+        """
+        self.write_many([row])
+
+    def write_many(self, rows):
+        """ Add or update records, appending all their rows in one write
+        Args:
+            rows (list): the records' complete rows
+        """
+        rows = [[str(value) for value in row] for row in rows]
+        if not rows:
+            return
+        with lock_for(self.filename):
+            records = self.records()
+            self._append(rows)
+            for row in rows:
+                records[row[self.key_column]] = row
+            self._compact_if_stale()
+
+    def delete(self, key):
+        """ Delete a record by appending its tombstone
+        Args:
+            key (str): the record's key
+        """
+        self.delete_many([key])
+
+    def delete_many(self, keys):
+        """ Delete records by appending all their tombstones in one write
+        Args:
+            keys (iterable): the records' keys; unknown keys are skipped
+        """
+        with lock_for(self.filename):
+            records = self.records()
+            removed = [records.pop(key) for key in set(keys) if key in records]
+            if not removed:
+                return
+            self._append([row + [TOMBSTONE] for row in removed])
+            self._compact_if_stale()
+
+    def _compact_if_stale(self):
+        """ Compact once enough of the file is tombstones and shadowed rows
+        """
+        if self._rows >= COMPACT_MIN_ROWS and self.stale_ratio() >= COMPACT_RATIO:
+            self.compact()
+
+    def stale_ratio(self):
+        """ Returns:
+            share of the rows in the file that no longer hold a live record
+        """
+        records = self.records()
+        if not self._rows:
+            return 0.0
+        return (self._rows - len(records)) / self._rows
+
+    def compact(self):
+        """ Rewrite the log to its live rows; readers see either the old or the new file
+        """
+        with lock_for(self.filename):
+            records = self.records()
+            write_rows(self.filename, records.values())
+            self._rows = len(records)
+            self._stamp = self._file_stamp()
@@ -1,10 +1,12 @@
 from account_manager import AccountManager
 from check_input import *
+from cli_storage import CliStorage
+from services import DaycareService
 
 
 def main():    
     login = True    
-    manager = AccountManager()
+    manager = AccountManager(DaycareService(CliStorage())) # storage repairs interrupted writes on startup
     while login:
         print("Welcome to the digital pet daycare!")        
         user = manager.handle_login()
@@ -24,14 +26,10 @@ def main():
                             match task_menu_opt:
                                 case 1: #mark complete
                                     pet.mark_list_complete()
-                                    user.save_pets()
                                 case 2: #mark incomplete
                                     pet.mark_list_incomplete()
-                                    user.save_pets()
                                 case 3: # Challenge
                                     pet.process_challenge()
-                                    # saves pet's challenge and status
-                                    user.save_pets()
                                 case 4: # activity center
                                     pet.task_handler()
                                 case 5: # Return
@@ -52,6 +50,7 @@ def main():
                         case 1: # delete current account
                             deletion = get_yes_no("This account will be permanently removed, are you sure? ")
                             if deletion:                   
+                                user.flush()
                                 manager.delete_account(user)
                                 session = False
                                 print("Going back to Login...")
@@ -60,9 +59,12 @@ def main():
                         case 2:
                             print("Going back..")                            
                 case 5: # back to main menu
+                    user.flush() # logout saves everything pending
                     print()
                     break
-                              
+            
+            # changes made during this visit are written in one go
+            user.flush()
             print()
     print("See you again!")
     
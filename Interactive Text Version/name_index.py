@@ -0,0 +1,75 @@
+from bisect import bisect_left, bisect_right
+
+PREFIX_END = "\U0010ffff" # sorts after every character a username can continue with
+
+
+class NameIndex:
+    """ Usernames kept sorted case-insensitively, so the names starting with a prefix are one
+    contiguous run found with two binary searches instead of a scan over every account
+    Attributes:
+        _keys (list): lowercased names in sorted order
+        _names (list): the names themselves, in the same order as _keys
+    """
+    def __init__(self, names=()):
+        """ Args:
+            names (iterable, optional): names to index. Defaults to none
+        """
+        pairs = sorted((name.lower(), name) for name in names)
+        self._keys = [key for key, name in pairs]
+        self._names = [name for key, name in pairs]
+
+    def __len__(self):
+        return len(self._names)
+
+    def add(self, name):
+        """ Args:
+            name (str): name to index
+        """
+        index = bisect_right(self._keys, name.lower())
+        self._keys.insert(index, name.lower())
+        self._names.insert(index, name)
+
+    def remove(self, name):
+        """ Args:
+            name (str): name to drop; unknown names are skipped
+        """
+        key = name.lower()
+        index = bisect_left(self._keys, key)
+        while index < len(self._keys) and self._keys[index] == key:
+            if self._names[index] == name:
+                del self._keys[index]
+                del self._names[index]
+                return
+            index += 1
+
+    def _range(self, prefix):
+        """ Args:
+            prefix (str): start of the names to find, any case
+        Returns:
+            tuple of the first and one past the last position of the matching names
+        """
+        prefix = prefix.lower()
+        return bisect_left(self._keys, prefix), bisect_left(self._keys, prefix + PREFIX_END)
+
+    def count(self, prefix=""):
+        """ Args:
+            prefix (str, optional): start of the names to count. Defaults to every name
+        Returns:
+            number of names starting with prefix
+        """
+        low, high = self._range(prefix)
+        return high - low
+
+    def matches(self, prefix="", limit=None, start=0):
+        """ Args:
+            prefix (str, optional): start of the names to find, any case. Defaults to every name
+            limit (int, optional): most names to return. Defaults to all of them
+            start (int, optional): matches to skip first, for paging. Defaults to 0
+        Returns:
+            list of the matching names in alphabetical order
+        """
+        low, high = self._range(prefix)
+        low += start
+        if limit is not None:
+            high = min(high, low + limit)
+        return self._names[low:high]
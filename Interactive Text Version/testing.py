@@ -0,0 +1,103 @@
+from account import Account
+from account_manager import AccountManager
+from cli_storage import CliStorage
+from services import DaycareService
+from rules import MAX_STATUS
+import unittest
+from unittest.mock import patch
+import csv, os, tempfile
+
+
+def read_csv(filename):
+    """ Args:
+        filename (str): a data file in the working directory
+    Returns:
+        list of its rows
+    """
+    with open(filename, mode="r", newline="") as file:
+        return [row for row in csv.reader(file) if row]
+
+
+class TestCliStorage(unittest.TestCase):
+    def setUp(self):
+        # run inside a scratch directory so the real csv files are untouched
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.service = DaycareService(CliStorage())
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_pets_keep_the_text_columns(self):
+        user_id = self.service.create_user("user1")
+        account = Account(self.service, "user1", user_id)
+        with patch("account.get_username", return_value="Rex"), patch("account.get_int_range", return_value=3):
+            account.add_pet()
+        pet = account.pets[0]
+        self.assertEqual((pet.status, pet.species, pet.event), (MAX_STATUS, 3, 0))
+        self.assertEqual(len(read_csv("pets.csv")[0]), 7)
+
+        pet.event = 1 # challenge attempted
+        account.flush()
+        user_id, name, pet_id, status, species, challenge, last_date = read_csv("pets.csv")[0]
+        self.assertEqual((name, status, species, challenge), ("Rex", "5", "3", "1"))
+
+        reloaded = Account(self.service, "user1", user_id).pets[0]
+        self.assertEqual((reloaded.name, reloaded.status, reloaded.event), ("Rex", MAX_STATUS, 1))
+
+    def test_new_day_resets_pets(self):
+        with open("pets.csv", mode="w", newline="") as file:
+            csv.writer(file).writerow(["10001", "Rex", "20001", 4, 2, 1, "2024-01-01"])
+        pet = Account(self.service, "user1", "10001").pets[0]
+        self.assertEqual((pet.status, pet.event, pet.species), (1, 0, 2))
+
+    def test_challenge_survives_checklist_toggle(self):
+        account = Account(self.service, "user1", self.service.create_user("user1"))
+        pet = self.service.create_pet(account.user_id, "Rex", 1, account.make_pet, species=1, status=1)
+        for description in ("Walk", "Feed"):
+            self.service.create_task(pet, description)
+        with patch("pet.random.randint", return_value=2), patch("challenge.random.random", return_value=0.0):
+            pet.process_challenge() # won the swim: +2
+        self.assertEqual(pet.status, 3)
+
+        with patch("pet.get_int_range", return_value=1):
+            pet.mark_list_complete() # half the tasks done: task mood 1 -> 3
+            self.assertEqual(pet.status, 5)
+            pet.mark_list_incomplete()
+        self.assertEqual(pet.status, 3)
+
+    def test_list_number_before_search(self):
+        for username in ("alice", "2bob"):
+            self.service.create_user(username)
+        manager = AccountManager(self.service) # listed as 1. 2bob, 2. alice
+        with patch("builtins.input", side_effect=["2"]):
+            self.assertEqual(manager.choose_account().username, "alice")
+        with patch("builtins.input", side_effect=["/2", "1"]): # search for names starting with 2
+            self.assertEqual(manager.choose_account().username, "2bob")
+        with patch("builtins.input", side_effect=["al", "1"]):
+            self.assertEqual(manager.choose_account().username, "alice")
+
+    def test_tasks_and_deletion_go_through_the_service(self):
+        manager = AccountManager(self.service)
+        with patch("account_manager.get_username", return_value="user1"):
+            account = manager.create_account()
+        with patch("account.get_username", return_value="Rex"), patch("account.get_int_range", return_value=1):
+            account.add_pet()
+        pet = account.pets[0]
+        with patch("builtins.input", return_value="Walk"):
+            pet.add_activity()
+        pet.set_task_status(pet.tasks[0], 1)
+        account.flush()
+        self.assertEqual(read_csv("tasks.csv"), [[pet.pet_id, pet.tasks[0].task_id, "Walk", "1"]])
+        self.assertEqual(AccountManager(self.service)._users[account.user_id].username, "user1")
+
+        manager.delete_account(account) # pets and tasks go with it
+        self.assertEqual(read_csv("pets.csv"), [])
+        self.assertEqual(read_csv("tasks.csv"), [])
+        self.assertEqual(AccountManager(self.service)._users, {})
+
+
+if __name__ == "__main__":
+    unittest.main()